@@ -5,9 +5,33 @@ This example shows how to create custom analysis rules and prompts
 for company-specific security standards and coding conventions.
 """
 
-# Custom prompt for company-specific security standards
+import asyncio
+import bisect
+import functools
+import hashlib
+import logging
+import os
+import shelve
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Prefer the third-party regex engine, which copes better with the
+# lookaround-heavy rules; fall back to the stdlib re module
+try:
+    import regex as re2
+    _RULE_FLAGS = re2.MULTILINE | re2.VERSION1
+except ImportError:
+    import re as re2
+    _RULE_FLAGS = re2.MULTILINE
+
+# Custom prompt for company-specific security standards.
+# The prompts are static so they can be sent as a cached system block; the
+# language and code travel separately in the user message.
 COMPANY_SECURITY_PROMPT = """
-Analyze the following {language} code for company-specific security violations.
+Analyze the code in the user message for company-specific security violations.
 
 Company Security Standards:
 1. All API endpoints must use authentication
@@ -18,11 +42,6 @@ Company Security Standards:
 6. Secrets must be stored in company secret manager
 7. All logging must exclude sensitive data
 
-Code:
-```{language}
-{code}
-```
-
 For each violation found, provide:
 - Type: COMPANY_SECURITY_VIOLATION
 - Severity: critical, high, medium, or low
@@ -32,23 +51,23 @@ For each violation found, provide:
 - Confidence: 0.0 to 1.0
 
 Format as JSON:
-{{
+{
   "findings": [
-    {{
+    {
       "type": "COMPANY_SECURITY_VIOLATION",
       "severity": "high",
       "line": 42,
       "message": "Hardcoded API key found - violates company security standard #2",
       "remediation": "Move API key to environment variable or company secret manager",
       "confidence": 0.95
-    }}
+    }
   ]
-}}
+}
 """
 
 # Custom prompt for framework-specific rules
 FRAMEWORK_PROMPT = """
-Analyze the following {language} code for framework best practices.
+Analyze the code in the user message for framework best practices.
 
 Framework: Django
 Standards:
@@ -58,91 +77,232 @@ Standards:
 4. Use Django's form validation
 5. Follow Django's project structure
 
-Code:
-```{language}
-{code}
-```
-
 Identify violations and provide findings in JSON format.
 """
 
-# Example: Using custom prompts
-def analyze_with_custom_rules(code, language, custom_prompt):
-    """Analyze code with custom rules."""
+# Model used for custom-rule analysis
+CUSTOM_RULES_MODEL = "claude-3-5-sonnet-20241022"
+
+# Response cache: repeat analyses of unchanged code skip the API call.
+# Set PROACTIVE_CACHE=0 to bypass it.
+RESPONSE_CACHE_DIR = Path.home() / ".cache" / "proactive-analyzer"
+RESPONSE_CACHE_TTL_SECONDS = 7 * 86400
+
+
+def _request_kwargs(code, language, custom_prompt):
+    """Build messages.create arguments with the rules prompt marked for caching.
+
+    The static rules prompt is the cached system prefix; only the
+    language fence and the code vary per request.
+    """
+    return {
+        "model": CUSTOM_RULES_MODEL,
+        "max_tokens": 4096,
+        "system": [{
+            "type": "text",
+            "text": custom_prompt,
+            "cache_control": {"type": "ephemeral"}
+        }],
+        # The code is its own content block so it is never copied into a
+        # larger concatenated prompt string
+        "messages": [{
+            "role": "user",
+            "content": [
+                {"type": "text", "text": f"```{language}\n"},
+                {"type": "text", "text": code},
+                {"type": "text", "text": "\n```"},
+            ]
+        }],
+        "extra_headers": {"anthropic-beta": "prompt-caching-2024-07-31"},
+    }
+
+
+class _UnparseableResponse(Exception):
+    """Raised inside the cached lookup so a failed parse is never cached."""
+
+
+def _call_claude(code, language, custom_prompt):
+    """Send one custom-rules analysis request to Claude.
+
+    Returns the findings, or None if the response could not be parsed.
+    """
     from src.core.analyzer import CodeAnalyzer
     from anthropic import Anthropic
-    import os
     
     analyzer = CodeAnalyzer()
     
-    # Format custom prompt
-    formatted_prompt = custom_prompt.format(
-        language=language,
-        code=code
-    )
-    
-    # Call Claude API with custom prompt
+    # Call Claude API with the cached rules prompt and the code to analyze
     client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
-    response = client.messages.create(
-        model="claude-3-5-sonnet-20241022",
-        max_tokens=4096,
-        messages=[{
-            "role": "user",
-            "content": formatted_prompt
-        }]
+    response = client.messages.create(**_request_kwargs(code, language, custom_prompt))
+    
+    # Parse response with the standard analyzer parser
+    return analyzer._parse_findings(response.content[0].text, "unknown")
+
+
+async def _analyze_files_async(files_data, custom_prompt):
+    """Run custom-rules analysis for many files concurrently.
+
+    Requests share one AsyncAnthropic client and are bounded by
+    ANALYZE_CONCURRENCY (default 8) in-flight calls. A file whose request
+    fails is logged and skipped without discarding the other results.
+    """
+    from src.core.analyzer import CodeAnalyzer
+    from anthropic import AsyncAnthropic
+    
+    analyzer = CodeAnalyzer()
+    client = AsyncAnthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+    sem = asyncio.Semaphore(int(os.getenv("ANALYZE_CONCURRENCY", "8")))
+    
+    async def _one(file_data):
+        async with sem:
+            response = await client.messages.create(
+                **_request_kwargs(file_data["content"], file_data["language"], custom_prompt)
+            )
+        return analyzer._parse_api_response(response.content[0].text, file_data["path"])
+    
+    results = await asyncio.gather(
+        *[_one(file_data) for file_data in files_data], return_exceptions=True
     )
     
-    # Parse response (similar to analyzer._parse_api_response)
-    # ... parsing logic ...
+    findings = []
+    for file_data, result in zip(files_data, results):
+        if isinstance(result, Exception):
+            logger.error(f"Error analyzing {file_data['path']} with custom rules: {result}")
+            continue
+        findings.extend(result)
+    return findings
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_analysis(code, language, custom_prompt):
+    """Look up an analysis in the on-disk cache, calling Claude on a miss."""
+    key = hashlib.sha256(
+        f"{custom_prompt}\0{language}\0{code}".encode()
+    ).hexdigest() + ":" + CUSTOM_RULES_MODEL
+    
+    RESPONSE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    db_path = str(RESPONSE_CACHE_DIR / "responses")
+    
+    with shelve.open(db_path) as db:
+        try:
+            entry = db.get(key)
+        except Exception as e:
+            # Entries pickled from an older Finding layout can't be loaded
+            logger.debug(f"Ignoring unreadable cache entry {key}: {e}")
+            entry = None
+    if entry and time.time() - entry[0] < RESPONSE_CACHE_TTL_SECONDS:
+        return entry[1]
     
+    findings = _call_claude(code, language, custom_prompt)
+    if findings is None:
+        # lru_cache does not store calls that raise
+        raise _UnparseableResponse(key)
+    with shelve.open(db_path) as db:
+        db[key] = (time.time(), findings)
     return findings
 
 
+# Example: Using custom prompts
+def analyze_with_custom_rules(code, language, custom_prompt):
+    """Analyze code with custom rules.
+
+    The static rules prompt is marked for Anthropic prompt caching, so
+    repeated calls only pay prefill for the code being analyzed. Results
+    are also cached in-process and on disk for a week; responses that
+    cannot be parsed are not cached.
+    """
+    if os.getenv("PROACTIVE_CACHE", "1") == "0":
+        return _call_claude(code, language, custom_prompt) or []
+    
+    try:
+        return list(_cached_analysis(code, language, custom_prompt))
+    except _UnparseableResponse:
+        return []
+
+
 # Example: Custom rule for specific patterns
 CUSTOM_PATTERN_RULES = {
     "hardcoded_secrets": {
         "pattern": r"(api[_-]?key|password|secret|token)\s*=\s*['\"][^'\"]+['\"]",
         "severity": "critical",
+        "anchors": ("api", "password", "secret", "token"),
         "message": "Hardcoded secret detected",
         "remediation": "Use environment variables or secret manager"
     },
     "sql_injection_risk": {
         "pattern": r"f?['\"].*SELECT.*\{.*\}.*['\"]",
         "severity": "critical",
+        "anchors": ("SELECT",),
         "message": "Potential SQL injection - string formatting in SQL",
         "remediation": "Use parameterized queries or ORM"
     },
     "missing_error_handling": {
         "pattern": r"def\s+\w+\([^)]*\):\s*\n\s*(?!.*try:).*",
         "severity": "medium",
+        "anchors": ("def",),
         "message": "Function missing error handling",
         "remediation": "Add try-except blocks for error handling"
     }
 }
 
+# Each rule is compiled once and scanned on its own so overlapping matches
+# from different rules are all reported. A rule is only scanned when one of
+# its literal anchors occurs in the file, since it cannot match otherwise.
+@functools.lru_cache(maxsize=None)
+def _compiled_rule(rule_name):
+    """Compile the pattern for a single rule."""
+    return re2.compile(CUSTOM_PATTERN_RULES[rule_name]["pattern"], _RULE_FLAGS)
+
+
+@functools.lru_cache(maxsize=None)
+def _rule_templates():
+    """Resolve the per-rule Finding fields once, keyed by rule name."""
+    from src.core.findings import FindingType, Severity
+    
+    return {
+        name: {
+            "type": FindingType.SECURITY,
+            "severity": Severity[rule["severity"].upper()],
+            "message": rule["message"],
+            "remediation": rule["remediation"],
+            "confidence": 0.8,
+            "rule_id": name,
+        }
+        for name, rule in CUSTOM_PATTERN_RULES.items()
+    }
+
 
 def check_custom_patterns(code, file_path):
     """Check code against custom pattern rules."""
-    import re
-    from src.core.findings import Finding, FindingType, Severity, Location
+    from src.core.findings import Finding, Location
     
     findings = []
+    templates = _rule_templates()
+    
+    active_rules = tuple(
+        name
+        for name, rule in CUSTOM_PATTERN_RULES.items()
+        if any(anchor in code for anchor in rule["anchors"])
+    )
+    if not active_rules:
+        return findings
+    
+    # Index newline offsets once so each match resolves its line via bisect
+    newlines = []
+    i = code.find('\n')
+    while i != -1:
+        newlines.append(i)
+        i = code.find('\n', i + 1)
     
-    for rule_name, rule in CUSTOM_PATTERN_RULES.items():
-        matches = re.finditer(rule["pattern"], code, re.MULTILINE)
-        
-        for match in matches:
-            line_number = code[:match.start()].count('\n') + 1
+    for rule_name in active_rules:
+        template = templates[rule_name]
+        for match in _compiled_rule(rule_name).finditer(code):
+            line_number = bisect.bisect_right(newlines, match.start()) + 1
             
             finding = Finding(
-                type=FindingType.SECURITY,
-                severity=Severity[rule["severity"].upper()],
-                message=rule["message"],
                 location=Location(file_path=file_path, line=line_number),
-                remediation=rule["remediation"],
-                confidence=0.8,
                 code_snippet=match.group(0),
-                rule_id=rule_name
+                **template
             )
             
             findings.append(finding)
@@ -150,29 +310,58 @@ def check_custom_patterns(code, file_path):
     return findings
 
 
+# Files larger than this are not scanned (generated code, bundles, data)
+MAX_SCAN_BYTES = int(os.getenv("MAX_SCAN_BYTES", str(2 * 1024 * 1024)))
+
+
+def _should_scan(file_data):
+    """Check whether a file is worth running the custom passes on."""
+    if file_data["size_bytes"] > MAX_SCAN_BYTES:
+        logger.info(f"Skipping oversize file {file_data['path']} ({file_data['size_bytes']} bytes)")
+        return False
+    if "\x00" in file_data["content"][:8192]:
+        logger.info(f"Skipping binary file {file_data['path']}")
+        return False
+    return True
+
+
 # Example: Combine custom rules with standard analysis
-def comprehensive_analysis_with_custom_rules(directory):
-    """Run comprehensive analysis including custom rules."""
+def comprehensive_analysis_with_custom_rules(directory, custom_prompt=None):
+    """Run comprehensive analysis including custom rules.
+
+    When custom_prompt is given, every file is also analyzed against it,
+    with the Claude requests issued concurrently.
+    """
     from src.core.analyzer import CodeAnalyzer
     from src.core.parser import CodeParser
     
     analyzer = CodeAnalyzer()
     parser = CodeParser()
     
+    # Read each file once; the standard analysis and the custom passes
+    # below all work from the same file data
+    files_data = parser.analyze_files(parser.get_files_to_analyze(directory))
+    
     # Standard analysis
-    result = analyzer.analyze_directory(directory, parser=parser)
+    result = analyzer.analyze_files_data(files_data, directory=directory)
     
     # Add custom pattern checks
-    files = parser.get_files_to_analyze(directory)
-    for file_path in files:
-        file_data = parser.analyze_file(file_path)
-        if file_data:
-            custom_findings = check_custom_patterns(
-                file_data["content"],
-                file_data["path"]
-            )
+    files_data = [file_data for file_data in files_data if _should_scan(file_data)]
+    
+    # Regex scanning is CPU-bound, so spread it across worker processes
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for custom_findings in executor.map(
+            check_custom_patterns,
+            [file_data["content"] for file_data in files_data],
+            [file_data["path"] for file_data in files_data],
+            chunksize=16,
+        ):
             result.findings.extend(custom_findings)
     
+    # Add custom prompt analysis
+    if custom_prompt:
+        result.findings.extend(asyncio.run(_analyze_files_async(files_data, custom_prompt)))
+    
     return result
 
 
@@ -47,11 +47,18 @@ if not API_KEY or not DATABASE_PASSWORD:
 # SECURITY: XSS Vulnerability - FIXED
 import html
 
+try:
+    # markupsafe (installed with Jinja2) escapes in C
+    from markupsafe import escape as _escape_html
+except ImportError:
+    def _escape_html(value):
+        return html.escape(str(value))
+
 def secure_web_page(user_input):
     """Secure web page with XSS protection."""
     # FIXED: Sanitize user input to prevent XSS attacks
-    # Option 1: Use html.escape() for HTML content
-    sanitized_input = html.escape(str(user_input))
+    # Option 1: Escape HTML content (markupsafe, falling back to html.escape())
+    sanitized_input = _escape_html(user_input)
     html_content = f"<div>Welcome {sanitized_input}</div>"
     
     # Option 2: Use a templating engine with auto-escaping (e.g., Jinja2)
@@ -96,30 +103,47 @@ def long_function():
     pass
 
 
-# QUALITY: Duplicate Code
-def calculate_total_v1(items):
-    """First version of calculation."""
-    total = 0
-    for item in items:
-        total += item.price
-    return total
+# QUALITY: Duplicate Code - FIXED
+# FIXED: One implementation; sum() over attrgetter accumulates in C
+from operator import attrgetter
+
+_price = attrgetter("price")
+
+def calculate_total(items):
+    """Sum the price of all items."""
+    return sum(map(_price, items))
 
 
-def calculate_total_v2(items):
-    """Second version - duplicate of v1."""
-    total = 0
-    for item in items:
-        total += item.price
-    return total
+# Former duplicate names kept as aliases for backwards compatibility
+calculate_total_v1 = calculate_total
+calculate_total_v2 = calculate_total
 
 
-# SECURITY: Insecure Random
+# SECURITY: Insecure Random - FIXED
 import random
+import secrets
 
 def generate_token():
-    """Insecure random token generation."""
-    return random.randint(1000, 9999)
-    # Should use: secrets.token_urlsafe()
+    """Secure 4-digit token generation."""
+    # FIXED: Use the secrets module (OS CSPRNG) instead of random
+    return secrets.randbelow(9000) + 1000
+
+
+def generate_tokens(n):
+    """Generate n secure 4-digit tokens from a single entropy read."""
+    if n == 1:
+        return [generate_token()]
+    # 4 bytes per token keeps the modulo bias negligible (< 1e-5)
+    buf = secrets.token_bytes(4 * n)
+    return [
+        int.from_bytes(buf[i:i + 4], "big") % 9000 + 1000
+        for i in range(0, 4 * n, 4)
+    ]
+
+# Legacy vulnerable function kept for reference (DO NOT USE IN PRODUCTION)
+def generate_token_vulnerable():
+    """VULNERABLE: Do not use this function - kept only for demonstration."""
+    return random.randint(1000, 9999)  # VULNERABLE: predictable PRNG
 
 
 # SECURITY: Command Injection - FIXED
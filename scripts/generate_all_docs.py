@@ -8,22 +8,25 @@ Requirements:
 """
 
 import sys
+import shutil
 import subprocess
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+# Resolve pandoc once instead of spawning `pandoc --version` on every check
+PANDOC_AVAILABLE = shutil.which("pandoc") is not None
+
 def check_dependencies():
     """Check if required dependencies are installed."""
     missing = []
     
     # Check pandoc
-    try:
-        subprocess.run(["pandoc", "--version"], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    if not PANDOC_AVAILABLE:
         missing.append("pandoc")
     
     # Check python-pptx
@@ -34,8 +37,16 @@ def check_dependencies():
     
     return missing
 
-def generate_docx():
-    """Generate DOCX from Markdown using pandoc."""
+def _popen(cmd):
+    """Start a subprocess with captured text output."""
+    return subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+
+def start_docx():
+    """Start pandoc converting Markdown to DOCX.
+
+    Returns:
+        Tuple of (process, cmd, output_file), or None if it could not start
+    """
     docs_dir = project_root / "docs"
     output_dir = project_root / "documentation_output"
     output_dir.mkdir(exist_ok=True)
@@ -45,38 +56,51 @@ def generate_docx():
     
     if not input_file.exists():
         print(f"❌ Input file not found: {input_file}")
-        return False
+        return None
+    
+    cmd = [
+        "pandoc",
+        str(input_file),
+        "-o", str(output_file),
+        "--toc",
+        "--toc-depth=3",
+        "-V", "geometry:margin=1in",
+        "-V", "fontsize=11pt",
+        "--reference-doc=/System/Library/Templates/Blank.docx"  # Try system template
+    ]
     
     try:
-        cmd = [
-            "pandoc",
-            str(input_file),
-            "-o", str(output_file),
-            "--toc",
-            "--toc-depth=3",
-            "-V", "geometry:margin=1in",
-            "-V", "fontsize=11pt",
-            "--reference-doc=/System/Library/Templates/Blank.docx"  # Try system template
-        ]
-        
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        
-        if result.returncode != 0:
-            # Try without reference doc
-            cmd = cmd[:-1]
-            result = subprocess.run(cmd, capture_output=True, text=True)
-        
-        if result.returncode == 0:
-            print(f"✅ DOCX generated: {output_file}")
-            return True
-        else:
-            print(f"❌ Error generating DOCX: {result.stderr}")
-            return False
-            
+        return _popen(cmd), cmd, output_file
     except FileNotFoundError:
         print("❌ pandoc not found. Install: brew install pandoc (Mac) or apt-get install pandoc (Linux)")
+        return None
+
+def finish_docx(started):
+    """Wait for the DOCX conversion started by start_docx()."""
+    if started is None:
+        return False
+    
+    proc, cmd, output_file = started
+    _, stderr = proc.communicate()
+    
+    if proc.returncode != 0:
+        # Try without reference doc
+        result = subprocess.run(cmd[:-1], capture_output=True, text=True)
+        returncode, stderr = result.returncode, result.stderr
+    else:
+        returncode = 0
+    
+    if returncode == 0:
+        print(f"✅ DOCX generated: {output_file}")
+        return True
+    else:
+        print(f"❌ Error generating DOCX: {stderr}")
         return False
 
+def generate_docx():
+    """Generate DOCX from Markdown using pandoc."""
+    return finish_docx(start_docx())
+
 def generate_pptx():
     """Generate PPTX presentation."""
     try:
@@ -101,7 +125,6 @@ def copy_markdown():
     output_file = output_dir / "COMPLETE_DOCUMENTATION.md"
     
     if input_file.exists():
-        import shutil
         shutil.copy(input_file, output_file)
         print(f"✅ Markdown copied: {output_file}")
         return True
@@ -109,8 +132,12 @@ def copy_markdown():
         print(f"❌ Input file not found: {input_file}")
         return False
 
-def generate_html():
-    """Generate HTML from Markdown."""
+def start_html():
+    """Start pandoc converting Markdown to HTML.
+
+    Returns:
+        Tuple of (process, output_file), or None if it could not start
+    """
     docs_dir = project_root / "docs"
     output_dir = project_root / "documentation_output"
     output_dir.mkdir(exist_ok=True)
@@ -118,30 +145,41 @@ def generate_html():
     input_file = docs_dir / "COMPLETE_DOCUMENTATION.md"
     output_file = output_dir / "Proactive_Codebase_Testing_Platform.html"
     
+    cmd = [
+        "pandoc",
+        str(input_file),
+        "-o", str(output_file),
+        "--standalone",
+        "--toc",
+        "--toc-depth=3",
+        "--css=https://cdn.jsdelivr.net/npm/github-markdown-css@5/github-markdown.min.css"
+    ]
+    
     try:
-        cmd = [
-            "pandoc",
-            str(input_file),
-            "-o", str(output_file),
-            "--standalone",
-            "--toc",
-            "--toc-depth=3",
-            "--css=https://cdn.jsdelivr.net/npm/github-markdown-css@5/github-markdown.min.css"
-        ]
-        
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        
-        if result.returncode == 0:
-            print(f"✅ HTML generated: {output_file}")
-            return True
-        else:
-            print(f"⚠️  HTML generation skipped: {result.stderr}")
-            return False
-            
+        return _popen(cmd), output_file
     except FileNotFoundError:
         print("⚠️  pandoc not found. Skipping HTML generation.")
+        return None
+
+def finish_html(started):
+    """Wait for the HTML conversion started by start_html()."""
+    if started is None:
+        return False
+    
+    proc, output_file = started
+    _, stderr = proc.communicate()
+    
+    if proc.returncode == 0:
+        print(f"✅ HTML generated: {output_file}")
+        return True
+    else:
+        print(f"⚠️  HTML generation skipped: {stderr}")
         return False
 
+def generate_html():
+    """Generate HTML from Markdown."""
+    return finish_html(start_html())
+
 def main():
     """Generate all documentation formats."""
     print("📚 Generating Documentation in Multiple Formats\n")
@@ -164,17 +202,15 @@ def main():
     print("\n1. Generating Markdown...")
     results['markdown'] = copy_markdown()
     
-    # Generate DOCX
-    print("\n2. Generating DOCX...")
-    results['docx'] = generate_docx()
-    
-    # Generate PPTX
-    print("\n3. Generating PPTX...")
-    results['pptx'] = generate_pptx()
-    
-    # Generate HTML
-    print("\n4. Generating HTML...")
-    results['html'] = generate_html()
+    # Generate DOCX, PPTX and HTML concurrently; they are independent
+    print("\n2. Generating DOCX, PPTX and HTML...")
+    docx = start_docx()
+    html = start_html()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pptx_future = executor.submit(generate_pptx)
+        results['docx'] = finish_docx(docx)
+        results['html'] = finish_html(html)
+        results['pptx'] = pptx_future.result()
     
     # Summary
     print("\n" + "=" * 60)
@@ -1,115 +1,230 @@
 """Middleware for rate limiting, monitoring, and security."""
 
 import time
+import queue
 import logging
-from collections import defaultdict
-from typing import Callable
-from fastapi import Request, Response, status
+import threading
+from collections import OrderedDict
+from typing import List, Optional
+from fastapi import status
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
-
-logger = logging.getLogger(__name__)
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+try:
+    import redis.asyncio as aioredis
+    from redis.exceptions import RedisError
+except ImportError:  # redis is an optional dependency
+    aioredis = None
+    RedisError = Exception
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Rate limiting middleware."""
-
-    def __init__(self, app, requests_per_minute: int = 60):
-        super().__init__(app)
-        self.requests_per_minute = requests_per_minute
-        self.requests = defaultdict(list)
-
-    async def dispatch(self, request: Request, call_next: Callable):
-        """Check rate limit before processing request."""
-        client_ip = request.client.host if request.client else "unknown"
-        current_time = time.time()
-
-        # Clean old requests (older than 1 minute)
-        self.requests[client_ip] = [
-            req_time
-            for req_time in self.requests[client_ip]
-            if current_time - req_time < 60
-        ]
+logger = logging.getLogger(__name__)
 
-        # Check rate limit
-        if len(self.requests[client_ip]) >= self.requests_per_minute:
-            logger.warning(f"Rate limit exceeded for {client_ip}")
-            return JSONResponse(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                content={
-                    "detail": f"Rate limit exceeded. Maximum {self.requests_per_minute} requests per minute."
-                },
-                headers={"Retry-After": "60"},
-            )
+# Static security headers, pre-encoded for the ASGI response start message
+SECURITY_HEADERS = (
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"x-xss-protection", b"1; mode=block"),
+    (b"strict-transport-security", b"max-age=31536000; includeSubDomains"),
+    (b"content-security-policy", b"default-src 'self'"),
+)
 
-        # Record request
-        self.requests[client_ip].append(current_time)
 
-        # Process request
-        response = await call_next(request)
-        return response
+class RateLimiter:
+    """Per-client request rate limiter.
 
+    With a Redis URL, counts are shared by all workers through a fixed
+    one-minute window per client (INCR + EXPIRE). Otherwise, or whenever
+    Redis is unreachable, a per-process token bucket is used: it holds up
+    to requests_per_minute tokens, refills at requests_per_minute / 60
+    tokens per second of monotonic time, and each request spends one token.
+    """
 
-class MonitoringMiddleware(BaseHTTPMiddleware):
-    """Monitoring middleware for request/response tracking."""
+    # Maximum number of tracked clients; the least recently seen is evicted
+    MAX_CLIENTS = 10_000
 
-    async def dispatch(self, request: Request, call_next: Callable):
-        """Track request metrics."""
-        start_time = time.time()
+    # Socket and connect timeout for Redis calls; a slow or unreachable Redis
+    # falls back to the local limiter instead of stalling requests
+    REDIS_TIMEOUT_SECONDS = 0.25
 
-        # Process request
-        response = await call_next(request)
+    def __init__(self, requests_per_minute: int = 60, redis_url: Optional[str] = None):
+        self.requests_per_minute = requests_per_minute
+        self.capacity = float(requests_per_minute)
+        # Tokens per nanosecond
+        self.refill_rate = requests_per_minute / 60_000_000_000
+        # client_ip -> [tokens, last_refill_ns]; mutated in place
+        self.buckets: "OrderedDict[str, List[float]]" = OrderedDict()
+
+        self.redis = None
+        if redis_url:
+            if aioredis is None:
+                logger.warning("REDIS_URL is set but redis is not installed; using local rate limiting")
+            else:
+                self.redis = aioredis.from_url(
+                    redis_url,
+                    socket_timeout=self.REDIS_TIMEOUT_SECONDS,
+                    socket_connect_timeout=self.REDIS_TIMEOUT_SECONDS,
+                )
+
+    async def allow(self, client_ip: str) -> bool:
+        """Record a request from client_ip and check it against the limit.
+
+        Args:
+            client_ip: Client address used as the rate limit key
+
+        Returns:
+            True if the request is within the limit
+        """
+        if self.redis is not None:
+            try:
+                return await self._allow_redis(client_ip)
+            except RedisError as e:
+                logger.warning(f"Redis rate limiting failed, using local limiter: {e}")
+        return self._allow_local(client_ip)
+
+    async def _allow_redis(self, client_ip: str) -> bool:
+        """Count the request in Redis and check it against the limit."""
+        # Wall-clock minute so every worker agrees on the window
+        key = f"rl:{client_ip}:{int(time.time() // 60)}"
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.incr(key)
+            pipe.expire(key, 60)
+            count, _ = await pipe.execute()
+        return count <= self.requests_per_minute
+
+    def _allow_local(self, client_ip: str) -> bool:
+        """Spend a token from the client's in-process bucket if one is available."""
+        current_time = time.monotonic_ns()
+
+        bucket = self.buckets.get(client_ip)
+        if bucket is None:
+            bucket = self.buckets[client_ip] = [self.capacity, current_time]
+            if len(self.buckets) > self.MAX_CLIENTS:
+                self.buckets.popitem(last=False)
+        else:
+            self.buckets.move_to_end(client_ip)
+            # Refill for the time elapsed since the last request
+            bucket[0] = min(
+                self.capacity, bucket[0] + (current_time - bucket[1]) * self.refill_rate
+            )
+            bucket[1] = current_time
 
-        # Calculate duration
-        duration = time.time() - start_time
+        if bucket[0] < 1:
+            return False
 
-        # Log metrics
-        logger.info(
-            f"{request.method} {request.url.path} - "
-            f"Status: {response.status_code} - "
-            f"Duration: {duration:.3f}s - "
-            f"IP: {request.client.host if request.client else 'unknown'}"
-        )
+        # Record request
+        bucket[0] -= 1
+        return True
 
-        # Add custom headers
-        response.headers["X-Process-Time"] = str(duration)
-        response.headers["X-Request-ID"] = request.headers.get("X-Request-ID", "unknown")
 
-        return response
+class RequestLogger:
+    """Request log emitted from a background thread.
 
+    Records are handed over through a bounded queue, so message formatting
+    and handler I/O happen off the event loop. When the queue is full,
+    records are dropped rather than delaying responses.
+    """
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    """Add security headers to responses."""
+    QUEUE_SIZE = 10_000
 
-    async def dispatch(self, request: Request, call_next: Callable):
-        """Add security headers."""
-        response = await call_next(request)
+    def __init__(self):
+        self.queue: "queue.Queue[tuple]" = queue.Queue(maxsize=self.QUEUE_SIZE)
+        self._worker = threading.Thread(target=self._drain, name="request-log", daemon=True)
+        self._worker.start()
 
-        # Security headers
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-        response.headers["Content-Security-Policy"] = "default-src 'self'"
+    def log(self, method: str, path: str, status_code: int, duration: float, client_ip: str):
+        """Queue one request record without blocking."""
+        try:
+            self.queue.put_nowait((method, path, status_code, duration, client_ip))
+        except queue.Full:
+            pass
+
+    def _drain(self) -> None:
+        """Emit queued request records; runs on the background thread."""
+        while True:
+            method, path, status_code, duration, client_ip = self.queue.get()
+            logger.info(
+                "%s %s - Status: %d - Duration: %.3fs - IP: %s",
+                method,
+                path,
+                status_code,
+                duration,
+                client_ip,
+            )
 
-        return response
 
+class CombinedMiddleware:
+    """Rate limiting, monitoring, security headers and error handling.
+
+    A single pure-ASGI middleware, so each request pays for one wrapper
+    instead of one BaseHTTPMiddleware task and stream pair per concern.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        requests_per_minute: int = 60,
+        redis_url: Optional[str] = None,
+    ):
+        self.app = app
+        self.limiter = RateLimiter(requests_per_minute, redis_url)
+        self.request_log = RequestLogger()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_ns = time.monotonic_ns()
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
+        request_id = b"unknown"
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                request_id = value
+                break
+
+        response_started = False
+
+        async def send_wrapper(message: Message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                duration = (time.monotonic_ns() - start_ns) / 1_000_000_000
+                headers = list(message.get("headers", ()))
+                headers.extend(SECURITY_HEADERS)
+                headers.append((b"x-process-time", str(duration).encode()))
+                headers.append((b"x-request-id", request_id))
+                message = {**message, "headers": headers}
+                if logger.isEnabledFor(logging.INFO):
+                    self.request_log.log(
+                        scope["method"], scope["path"], message["status"], duration, client_ip
+                    )
+            await send(message)
 
-class ErrorHandlingMiddleware(BaseHTTPMiddleware):
-    """Global error handling middleware."""
+        # Check rate limit
+        if not await self.limiter.allow(client_ip):
+            logger.warning(f"Rate limit exceeded for {client_ip}")
+            response = JSONResponse(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                content={
+                    "detail": f"Rate limit exceeded. Maximum {self.limiter.requests_per_minute} requests per minute."
+                },
+                headers={"Retry-After": "60"},
+            )
+            await response(scope, receive, send_wrapper)
+            return
 
-    async def dispatch(self, request: Request, call_next: Callable):
-        """Handle errors globally."""
         try:
-            response = await call_next(request)
-            return response
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
             logger.exception(f"Unhandled exception: {e}")
-            return JSONResponse(
+            if response_started:
+                raise
+            response = JSONResponse(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 content={
                     "detail": "Internal server error",
                     "error_id": f"ERR-{int(time.time())}",
                 },
             )
-
+            await response(scope, receive, send_wrapper)
@@ -1,7 +1,7 @@
 """Pydantic models for API requests and responses."""
 
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from ..core.findings import FindingType, Severity
 
 
@@ -18,6 +18,12 @@ class AnalyzeRequest(BaseModel):
         default="unknown", description="Name of the file being analyzed"
     )
 
+    @field_validator("file_name", mode="before")
+    @classmethod
+    def _default_file_name(cls, value: Optional[str]) -> Optional[str]:
+        """Treat a null or empty file name as "unknown"."""
+        return value or "unknown"
+
     class Config:
         json_schema_extra = {
             "example": {
@@ -55,6 +61,14 @@ class AnalyzeResponse(BaseModel):
     message: Optional[str] = None
 
 
+class RootResponse(BaseModel):
+    """Response model for the root endpoint."""
+
+    message: str
+    version: str
+    docs: str
+
+
 class HealthResponse(BaseModel):
     """Response model for health check."""
 
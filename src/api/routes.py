@@ -1,11 +1,13 @@
 """API routes for code analysis."""
 
 import logging
-from typing import List
+from collections import Counter
+from typing import List, Optional
 from fastapi import APIRouter, HTTPException, status
 
 from ..core.analyzer import CodeAnalyzer
-from ..core.findings import Finding
+from ..core.findings import AnalysisResult, Finding
+from ..core.monitoring import PerformanceMonitor, log_analysis_metrics
 from .models import (
     AnalyzeRequest,
     AnalyzeResponse,
@@ -21,7 +23,7 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 # Supported languages
-SUPPORTED_LANGUAGES = [
+SUPPORTED_LANGUAGES = (
     "python",
     "javascript",
     "typescript",
@@ -41,28 +43,51 @@ SUPPORTED_LANGUAGES = [
     "json",
     "yaml",
     "sql",
-]
+)
+
+# Static responses, built once
+_HEALTH_RESPONSE = HealthResponse(status="ok", version=__version__)
+_LANGUAGES_RESPONSE = LanguagesResponse(languages=list(SUPPORTED_LANGUAGES))
+
+# Shared analyzer, created on first use by get_analyzer()
+_analyzer: Optional[CodeAnalyzer] = None
+
+
+def get_analyzer() -> CodeAnalyzer:
+    """Get the shared analyzer instance.
+
+    Reusing one analyzer keeps a single Anthropic client, and with it a warm
+    HTTPS connection pool, across requests. Its result cache stays in
+    memory: submitted code is never written to disk, and nothing is shared
+    unsafely between worker processes.
+
+    Returns:
+        CodeAnalyzer instance
+    """
+    global _analyzer
+    if _analyzer is None:
+        _analyzer = CodeAnalyzer()
+    return _analyzer
 
 
 @router.post("/api/analyze", response_model=AnalyzeResponse)
 async def analyze_code(request: AnalyzeRequest):
     """Analyze code for security vulnerabilities, bugs, and quality issues."""
-    from ..core.monitoring import PerformanceMonitor, log_analysis_metrics
-        
     try:
         with PerformanceMonitor("api_analyze", tags={"language": request.language, "type": request.analysis_type}):
-            analyzer = CodeAnalyzer()
+            analyzer = get_analyzer()
 
             findings = analyzer.analyze_code(
                 code=request.code,
                 language=request.language,
-                file_name=request.file_name or "unknown",
+                file_name=request.file_name,
                 analysis_type=request.analysis_type,
             )
 
-            # Convert findings to response format
+            # Convert findings to response format; these are built from our own
+            # Finding objects, so skip Pydantic validation
             finding_responses = [
-                FindingResponse(
+                FindingResponse.model_construct(
                     type=f.type.value,
                     severity=f.severity.value,
                     message=f.message,
@@ -75,33 +100,31 @@ async def analyze_code(request: AnalyzeRequest):
                 for f in findings
             ]
 
+            # Count lines without materializing them
+            code = request.code
+            analysis_result = AnalysisResult(
+                findings=findings,
+                files_analyzed=1,
+                total_lines=code.count("\n") + (bool(code) and not code.endswith("\n")),
+            )
+
             # Calculate statistics
+            counts = Counter(f.severity.value for f in findings)
             findings_by_severity = {
-                "critical": len([f for f in findings if f.severity.value == "critical"]),
-                "high": len([f for f in findings if f.severity.value == "high"]),
-                "medium": len([f for f in findings if f.severity.value == "medium"]),
-                "low": len([f for f in findings if f.severity.value == "low"]),
-                "info": len([f for f in findings if f.severity.value == "info"]),
+                k: counts.get(k, 0) for k in ("critical", "high", "medium", "low", "info")
             }
 
             result = AnalyzeResponse(
                 findings=finding_responses,
-                files_analyzed=1,
-                total_lines=len(request.code.splitlines()),
+                files_analyzed=analysis_result.files_analyzed,
+                total_lines=analysis_result.total_lines,
                 findings_by_severity=findings_by_severity,
                 success=True,
             )
-            
+
             # Log metrics
-            from ..core.findings import AnalysisResult
-            analysis_result = AnalysisResult(
-                findings=findings,  # Use actual findings
-                files_analyzed=1,
-                total_lines=len(request.code.splitlines()),
-            )
-            
             log_analysis_metrics(analysis_result, request.analysis_type, request.language)
-            
+
             return result
 
     except ValueError as e:
@@ -120,13 +143,13 @@ async def analyze_code(request: AnalyzeRequest):
 @router.get("/api/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint."""
-    return HealthResponse(status="ok", version=__version__)
+    return _HEALTH_RESPONSE
 
 
 @router.get("/api/languages", response_model=LanguagesResponse)
 async def get_languages():
     """Get list of supported programming languages."""
-    return LanguagesResponse(languages=SUPPORTED_LANGUAGES)
+    return _LANGUAGES_RESPONSE
 
 
 @router.get("/api/stats", response_model=StatsResponse)
@@ -5,12 +5,8 @@ import logging
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from .routes import router
-from .middleware import (
-    RateLimitMiddleware,
-    MonitoringMiddleware,
-    SecurityHeadersMiddleware,
-    ErrorHandlingMiddleware,
-)
+from .models import RootResponse
+from .middleware import CombinedMiddleware
 
 # Configure logging
 from ..core.logging_config import setup_logging
@@ -28,14 +24,10 @@ app = FastAPI(
 )
 
 # Add middleware (order matters - last added is first executed)
-app.add_middleware(ErrorHandlingMiddleware)
-app.add_middleware(SecurityHeadersMiddleware)
-app.add_middleware(
-    MonitoringMiddleware,
-)
 app.add_middleware(
-    RateLimitMiddleware,
+    CombinedMiddleware,
     requests_per_minute=int(os.getenv("RATE_LIMIT_PER_MINUTE", "60")),
+    redis_url=os.getenv("REDIS_URL"),
 )
 app.add_middleware(
     CORSMiddleware,
@@ -49,7 +41,7 @@ app.add_middleware(
 app.include_router(router)
 
 
-@app.get("/")
+@app.get("/", response_model=RootResponse)
 async def root():
     """Root endpoint."""
     return {
@@ -6,12 +6,10 @@ from pathlib import Path
 from typing import Optional
 import typer
 
-from ..core.analyzer import CodeAnalyzer
-from ..core.parser import CodeParser
 from ..core.findings import Severity
-from ..reporters.json_reporter import JSONReporter
-from ..reporters.html_reporter import HTMLReporter
-from ..reporters.sarif_reporter import SARIFReporter
+
+# The analyzer (which pulls in the Anthropic SDK), parser and reporters are
+# imported inside the commands that use them to keep startup fast
 
 app = typer.Typer(help="Proactive Codebase Testing - AI-powered code analyzer")
 
@@ -26,19 +24,23 @@ logger = logging.getLogger(__name__)
 @app.command()
 def analyze(
     path: str = typer.Argument(..., help="Path to file or directory to analyze"),
-    format: str = typer.Option("console", "--format", "-f", help="Output format: json, html, sarif, console"),
-    output: Optional[str] = typer.Option(None, "--output", "-o", help="Output file path"),
+    format: str = typer.Option("console", "--format", "-f", help="Output format: json, html, sarif, all, console"),
+    output: Optional[str] = typer.Option(None, "--output", "-o", help="Output file path (base path for --format all)"),
     severity: Optional[str] = typer.Option(None, "--severity", "-s", help="Minimum severity: critical, high, medium, low"),
     fail_on_critical: bool = typer.Option(False, "--fail-on-critical", help="Exit with error code if critical findings found"),
     analysis_type: str = typer.Option("comprehensive", "--type", "-t", help="Analysis type: security, bugs, quality, comprehensive"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Ignore cached results and call the API for every file"),
 ):
     """Analyze code for security vulnerabilities, bugs, and quality issues."""
     try:
         typer.echo(f"Analyzing: {path}")
 
-        # Initialize components
+        from ..core.analyzer import ANALYSIS_CACHE_DIR, CodeAnalyzer
+        from ..core.parser import CodeParser
+
+        # Initialize components; the CLI keeps results on disk between runs
         parser = CodeParser()
-        analyzer = CodeAnalyzer()
+        analyzer = CodeAnalyzer(use_cache=not no_cache, cache_dir=str(ANALYSIS_CACHE_DIR))
 
         # Analyze directory or file
         if Path(path).is_file():
@@ -74,11 +76,27 @@ def analyze(
             }
             severity_enum = severity_map.get(severity.lower())
 
-        if format == "json":
+        if format == "all":
+            if not output:
+                typer.echo("Error: --format all requires --output", err=True)
+                sys.exit(1)
+            from ..reporters.multi_reporter import REPORTERS, save_all
+
+            # One file per format next to the given base path
+            base = Path(output)
+            paths = {fmt: str(base.with_suffix(f".{fmt}")) for fmt in REPORTERS}
+            save_all(result, paths, min_severity=severity_enum)
+            for report_path in paths.values():
+                typer.echo(f"Report saved to: {report_path}")
+            reporter = None
+        elif format == "json":
+            from ..reporters.json_reporter import JSONReporter
             reporter = JSONReporter(min_severity=severity_enum)
         elif format == "html":
+            from ..reporters.html_reporter import HTMLReporter
             reporter = HTMLReporter(min_severity=severity_enum)
         elif format == "sarif":
+            from ..reporters.sarif_reporter import SARIFReporter
             reporter = SARIFReporter(min_severity=severity_enum)
         else:  # console
             reporter = None
@@ -90,7 +108,7 @@ def analyze(
                 typer.echo(f"Report saved to: {output}")
             else:
                 typer.echo(reporter.generate(result))
-        else:
+        elif format != "all":
             # Console output
             _print_console_report(result, severity_enum)
 
@@ -116,11 +134,12 @@ def _print_console_report(result, min_severity: Optional[Severity] = None):
     # Summary
     typer.echo("\n=== Analysis Summary ===")
     typer.echo(f"Total Findings: {summary['total_findings']}")
-    typer.echo(f"Critical: {summary['findings_by_severity']['critical']}")
-    typer.echo(f"High: {summary['findings_by_severity']['high']}")
-    typer.echo(f"Medium: {summary['findings_by_severity']['medium']}")
-    typer.echo(f"Low: {summary['findings_by_severity']['low']}")
-    typer.echo(f"Info: {summary['findings_by_severity']['info']}")
+    by_severity = summary["findings_by_severity"]
+    typer.echo(f"Critical: {by_severity['critical']}")
+    typer.echo(f"High: {by_severity['high']}")
+    typer.echo(f"Medium: {by_severity['medium']}")
+    typer.echo(f"Low: {by_severity['low']}")
+    typer.echo(f"Info: {by_severity['info']}")
     typer.echo(f"Files Analyzed: {summary['files_analyzed']}")
     typer.echo(f"Total Lines: {summary['total_lines']}")
     typer.echo(f"Analysis Time: {summary['analysis_time_seconds']:.2f}s")
@@ -128,15 +147,8 @@ def _print_console_report(result, min_severity: Optional[Severity] = None):
     # Findings
     findings = result.findings
     if min_severity:
-        severity_order = {
-            Severity.CRITICAL: 0,
-            Severity.HIGH: 1,
-            Severity.MEDIUM: 2,
-            Severity.LOW: 3,
-            Severity.INFO: 4,
-        }
-        min_level = severity_order.get(min_severity, 4)
-        findings = [f for f in findings if severity_order.get(f.severity, 4) <= min_level]
+        min_level = min_severity.order
+        findings = [f for f in findings if f.severity.order <= min_level]
 
     if findings:
         typer.echo("\n=== Findings ===")
@@ -155,6 +167,8 @@ def _print_console_report(result, min_severity: Optional[Severity] = None):
 @app.command()
 def health():
     """Check if analyzer is properly configured."""
+    from ..core.analyzer import CodeAnalyzer
+
     try:
         analyzer = CodeAnalyzer()
         typer.echo("✓ Analyzer is properly configured")
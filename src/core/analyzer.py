@@ -1,31 +1,209 @@
 """Core analyzer using Claude API."""
 
 import os
+import re
 import json
 import time
+import asyncio
+import hashlib
 import logging
-from typing import List, Optional, Dict, Any
-from anthropic import Anthropic
+import shelve
+from collections import OrderedDict
+from contextvars import ContextVar
+from pathlib import Path
+from typing import List, Optional, Dict, Any, Tuple, Awaitable, Callable
+from anthropic import Anthropic, AsyncAnthropic
 from dotenv import load_dotenv
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional; the stdlib parser accepts bytes too
+    from json import loads as _json_loads
+
 from .findings import Finding, FindingType, Severity, Location, AnalysisResult
-from .prompts import get_prompt
+from .prompts import PROMPT_VERSION, get_batch_prompt, get_prompt
 
 logger = logging.getLogger(__name__)
 
 # Load environment variables
 load_dotenv()
 
+# Directory the CLI keeps its on-disk analysis cache (a shelve file) in
+ANALYSIS_CACHE_DIR = Path.home() / ".cache" / "proactive-codebase-testing"
+
+# Async client opened by the sync wrappers for the event loop they run;
+# an AsyncAnthropic connection pool cannot be reused on another loop
+_ASYNC_CLIENT: ContextVar[Optional[AsyncAnthropic]] = ContextVar("async_client", default=None)
+
+# Severity and type strings from API responses, mapped to enums
+_SEVERITY_MAP = {
+    "critical": Severity.CRITICAL,
+    "high": Severity.HIGH,
+    "medium": Severity.MEDIUM,
+    "low": Severity.LOW,
+    "info": Severity.INFO,
+}
+
+_TYPE_MAP = {
+    "SECURITY": FindingType.SECURITY,
+    "BUG": FindingType.BUG,
+    "QUALITY": FindingType.QUALITY,
+    "PERFORMANCE": FindingType.PERFORMANCE,
+    "ACCESSIBILITY": FindingType.ACCESSIBILITY,
+}
+
+
+# A ``` fence, with an optional language tag, that opens a JSON block
+_JSON_FENCE = re.compile(r"```[\w-]*\s*(?=[{\[])")
+
+
+def _extract_json(text: str) -> str:
+    """Extract the first JSON object from a Claude response.
+
+    Skips a ```json / ``` fence that comes before the first "{", or, after a
+    prose prefix, the first fence that opens a JSON block; fenced code after
+    the object is left alone. Then walks the text once from the first "{",
+    tracking brace depth and string state so braces inside string values
+    are ignored. Falls back to the first "[" when there is no object.
+
+    Args:
+        text: Raw response text
+
+    Returns:
+        The JSON slice, the rest of the text if the braces never balance, or
+        the text unchanged if it contains no JSON start
+    """
+    pos = 0
+    first = text.find("{")
+    fence = text.find("```")
+    if fence != -1 and (first == -1 or fence < first):
+        pos = fence + 3
+    elif first > 0 and text[:first].strip():
+        match = _JSON_FENCE.search(text, first)
+        if match:
+            pos = match.end()
+
+    start = text.find("{", pos)
+    if start == -1:
+        start = text.find("[", pos)
+        if start == -1:
+            return text
+
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{" or ch == "[":
+            depth += 1
+        elif ch == "}" or ch == "]":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+
+    return text[start:]
+
+
+class _JsonStreamScanner:
+    """Detect the end of the JSON object while a response is streamed.
+
+    Tracks the same brace and string state as _extract_json(), one chunk at a
+    time. The object only counts as complete early when _extract_json() would
+    pick the same slice from the full text: the response starts with it or a
+    ``` fence precedes it. Otherwise the whole response must be read.
+    """
+
+    def __init__(self):
+        self._parts: List[str] = []
+        self._head = ""
+        self._started = False
+        self._eligible = False
+        self._done = False
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    @property
+    def text(self) -> str:
+        """Text received so far."""
+        return "".join(self._parts)
+
+    def feed(self, chunk: str) -> bool:
+        """Add a streamed chunk.
+
+        Args:
+            chunk: Next piece of response text
+
+        Returns:
+            True once the JSON object is complete and no more text is needed
+        """
+        self._parts.append(chunk)
+        if self._done:
+            return False
+
+        offset = 0
+        if not self._started:
+            self._head += chunk
+            start = self._head.find("{")
+            if start == -1:
+                return False
+            self._started = True
+            prefix = self._head[:start]
+            self._eligible = "```" in prefix or not prefix.strip()
+            offset = len(chunk) - (len(self._head) - start)
+
+        for ch in chunk[offset:]:
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch == "{" or ch == "[":
+                self._depth += 1
+            elif ch == "}" or ch == "]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._done = True
+                    return self._eligible
+
+        return False
+
 
 class CodeAnalyzer:
     """Analyzer that uses Claude API to analyze code."""
 
+    # Maximum number of results kept in the in-memory cache
+    CACHE_MAXSIZE = 1024
+
+    # Limits for packing several files into one API request
+    BATCH_MAX_FILES = 10
+    BATCH_MAX_BYTES = 50_000
+
+    # Output token budget per file; a batch gets this much for each of its
+    # files, up to the model's output limit
+    MAX_TOKENS = 4096
+
     def __init__(
         self,
         api_key: Optional[str] = None,
         model: str = "claude-3-haiku-20240307",
         timeout: int = 30,
         max_retries: int = 3,
+        use_cache: bool = True,
+        cache_dir: Optional[str] = None,
     ):
         """Initialize analyzer.
 
@@ -34,6 +212,9 @@ class CodeAnalyzer:
             model: Claude model to use
             timeout: Request timeout in seconds
             max_retries: Maximum number of retries on failure
+            use_cache: Reuse findings for code that was already analyzed
+            cache_dir: Directory for an on-disk cache shared between runs
+                (None keeps the cache in memory only)
         """
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
         if not self.api_key:
@@ -42,46 +223,39 @@ class CodeAnalyzer:
             )
 
         self.client = Anthropic(api_key=self.api_key)
+        self.async_client = AsyncAnthropic(api_key=self.api_key)
         self.model = model
         self.timeout = timeout
         self.max_retries = max_retries
 
-    def _parse_finding(self, finding_data: Dict[str, Any], file_path: str) -> Finding:
+        self.use_cache = use_cache
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._cache: "OrderedDict[str, List[Finding]]" = OrderedDict()
+
+    def _parse_finding(self, finding_data: Dict[str, Any], file_path: Optional[str]) -> Finding:
         """Parse a single finding from API response.
 
         Args:
             finding_data: Finding data from API
-            file_path: Path to the file being analyzed
+            file_path: Path to the file being analyzed, or None for a batched
+                request, where each finding names its own file
 
         Returns:
             Finding object
         """
-        # Map severity string to enum
-        severity_str = finding_data.get("severity", "medium").lower()
-        severity_map = {
-            "critical": Severity.CRITICAL,
-            "high": Severity.HIGH,
-            "medium": Severity.MEDIUM,
-            "low": Severity.LOW,
-            "info": Severity.INFO,
-        }
-        severity = severity_map.get(severity_str, Severity.MEDIUM)
-
-        # Map type string to enum
-        type_str = finding_data.get("type", "QUALITY").upper()
-        type_map = {
-            "SECURITY": FindingType.SECURITY,
-            "BUG": FindingType.BUG,
-            "QUALITY": FindingType.QUALITY,
-            "PERFORMANCE": FindingType.PERFORMANCE,
-            "ACCESSIBILITY": FindingType.ACCESSIBILITY,
-        }
-        finding_type = type_map.get(type_str, FindingType.QUALITY)
+        # Map severity and type strings to enums
+        severity = _SEVERITY_MAP.get(
+            finding_data.get("severity", "medium").lower(), Severity.MEDIUM
+        )
+        finding_type = _TYPE_MAP.get(
+            finding_data.get("type", "QUALITY").upper(), FindingType.QUALITY
+        )
 
         # Get location
         line = finding_data.get("line")
         location = Location(
-            file_path=file_path,
+            # Batched requests name the file each finding belongs to
+            file_path=(finding_data.get("file_name") or "") if file_path is None else file_path,
             line=line,
             column=finding_data.get("column"),
             end_line=finding_data.get("end_line"),
@@ -100,6 +274,16 @@ class CodeAnalyzer:
             metadata=finding_data.get("metadata", {}),
         )
 
+    def _try_parse_finding(
+        self, finding_data: Dict[str, Any], file_path: Optional[str]
+    ) -> Optional[Finding]:
+        """Parse a single finding, logging and returning None on failure."""
+        try:
+            return self._parse_finding(finding_data, file_path)
+        except Exception as e:
+            logger.error(f"Error parsing finding: {e}, data: {finding_data}")
+            return None
+
     def _parse_api_response(self, response: str, file_path: str) -> List[Finding]:
         """Parse Claude API response into findings.
 
@@ -108,46 +292,244 @@ class CodeAnalyzer:
             file_path: Path to the file being analyzed
 
         Returns:
-            List of Finding objects
+            List of Finding objects, empty if the response could not be parsed
         """
-        findings = []
+        findings = self._parse_findings(response, file_path)
+        return [] if findings is None else findings
 
-        try:
-            # Try to extract JSON from markdown code blocks first
-            import re
-            json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', response, re.DOTALL)
-            if json_match:
-                response = json_match.group(1)
-            else:
-                # Try to find JSON object in the response
-                json_match = re.search(r'\{.*\}', response, re.DOTALL)
-                if json_match:
-                    response = json_match.group(0)
-            
-            # Try to parse as JSON
-            data = json.loads(response)
+    def _parse_findings(
+        self, response: str, file_path: Optional[str]
+    ) -> Optional[List[Finding]]:
+        """Parse Claude API response into findings, reporting parse failures.
 
-            # Handle different response formats
-            if isinstance(data, dict):
-                findings_data = data.get("findings", [])
-            elif isinstance(data, list):
-                findings_data = data
-            else:
-                logger.warning(f"Unexpected response format: {type(data)}")
-                return findings
+        Args:
+            response: API response text
+            file_path: Path to the file being analyzed, or None for a batch
 
-            # Parse each finding
-            for finding_data in findings_data:
-                try:
-                    finding = self._parse_finding(finding_data, file_path)
-                    findings.append(finding)
-                except Exception as e:
-                    logger.error(f"Error parsing finding: {e}, data: {finding_data}")
+        Returns:
+            List of Finding objects, or None if the response held no usable JSON
+        """
+        try:
+            # Strip any markdown fence or surrounding prose
+            response = _extract_json(response)
 
+            # Try to parse as JSON
+            data = _json_loads(response.encode())
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse API response as JSON: {e}")
-            logger.debug(f"Response text: {response[:500]}")
+            logger.debug("Response text: %s", response[:500])
+            return None
+
+        # Handle different response formats
+        if isinstance(data, dict):
+            findings_data = data.get("findings", [])
+        elif isinstance(data, list):
+            findings_data = data
+        else:
+            logger.warning(f"Unexpected response format: {type(data)}")
+            return None
+
+        # Parse each finding, dropping any that fail
+        return [
+            finding
+            for finding in (
+                self._try_parse_finding(finding_data, file_path)
+                for finding_data in findings_data
+            )
+            if finding is not None
+        ]
+
+    def _output_token_limit(self) -> int:
+        """Largest max_tokens the model accepts."""
+        # Claude 3 models cap output at 4096 tokens; later models allow more
+        if self.model.startswith("claude-3-") and not self.model.startswith("claude-3-5-"):
+            return 4096
+        return 8192
+
+    def _build_request(self, prompt: str, files: int = 1) -> Dict[str, Any]:
+        """Build the keyword arguments for a messages.stream call.
+
+        Args:
+            prompt: Prompt text
+            files: Number of files covered by the prompt
+
+        Returns:
+            Request keyword arguments
+        """
+        return {
+            "model": self.model,
+            "max_tokens": min(self.MAX_TOKENS * files, self._output_token_limit()),
+            "messages": [
+                {
+                    "role": "user",
+                    "content": prompt,
+                }
+            ],
+            "timeout": self.timeout,
+        }
+
+    def _stream_text(self, request: Dict[str, Any], label: str) -> Optional[str]:
+        """Send a request with retries and return the streamed response text.
+
+        Reading stops once the findings JSON is complete.
+
+        Args:
+            request: Keyword arguments for messages.stream
+            label: What is being analyzed, for log messages
+
+        Returns:
+            Response text, or None if every attempt failed
+        """
+        for attempt in range(self.max_retries):
+            try:
+                scanner = _JsonStreamScanner()
+                with self.client.messages.stream(**request) as stream:
+                    for chunk in stream.text_stream:
+                        if scanner.feed(chunk):
+                            break
+                return scanner.text
+
+            except Exception as e:
+                logger.error(
+                    f"Error calling Claude API (attempt {attempt + 1}/{self.max_retries}): {e}"
+                )
+                if attempt < self.max_retries - 1:
+                    time.sleep(2 ** attempt)  # Exponential backoff
+                else:
+                    logger.error(f"Failed to analyze {label} after {self.max_retries} attempts")
+
+        return None
+
+    async def _stream_text_async(self, request: Dict[str, Any], label: str) -> Optional[str]:
+        """Async version of _stream_text() using the async client."""
+        client = _ASYNC_CLIENT.get() or self.async_client
+        for attempt in range(self.max_retries):
+            try:
+                scanner = _JsonStreamScanner()
+                async with client.messages.stream(**request) as stream:
+                    async for chunk in stream.text_stream:
+                        if scanner.feed(chunk):
+                            break
+                return scanner.text
 
+            except Exception as e:
+                logger.error(
+                    f"Error calling Claude API (attempt {attempt + 1}/{self.max_retries}): {e}"
+                )
+                if attempt < self.max_retries - 1:
+                    await asyncio.sleep(2 ** attempt)  # Exponential backoff
+                else:
+                    logger.error(f"Failed to analyze {label} after {self.max_retries} attempts")
+
+        return None
+
+    def _handle_response(self, response_text: str, file_name: str) -> Optional[List[Finding]]:
+        """Extract findings from streamed Claude API response text.
+
+        Returns None when the response is empty or cannot be parsed, so the
+        caller knows not to cache it.
+        """
+        if not response_text:
+            logger.error("Empty response from Claude API")
+            return None
+
+        # Parse findings
+        findings = self._parse_findings(response_text, file_name)
+        if findings is None:
+            return None
+        logger.info("Analysis complete for %s: %d findings", file_name, len(findings))
+        return findings
+
+    def _cache_key(
+        self, code: str, language: str, file_name: str, analysis_type: str
+    ) -> str:
+        """Build the cache key for one analysis request.
+
+        The prompt version is part of the key, so results produced with an
+        older prompt wording are not reused.
+        """
+        return hashlib.blake2b(
+            f"{PROMPT_VERSION}|{self.model}|{language}|{analysis_type}|{file_name}|{code}".encode(),
+            digest_size=16,
+        ).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[List[Finding]]:
+        """Look up cached findings, in memory first and then on disk."""
+        findings = self._cache.get(key)
+        if findings is not None:
+            self._cache.move_to_end(key)
+            return list(findings)
+
+        if self.cache_dir is None:
+            return None
+        try:
+            with shelve.open(str(self.cache_dir / "analyses")) as db:
+                findings = db.get(key)
+        except Exception as e:
+            logger.debug(f"Analysis cache unavailable: {e}")
+            return None
+
+        if findings is not None:
+            self._remember(key, findings)
+            return list(findings)
+        return None
+
+    def _cache_put(self, key: str, findings: List[Finding]) -> None:
+        """Store findings in memory and, with a cache_dir, on disk."""
+        self._remember(key, findings)
+        if self.cache_dir is None:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with shelve.open(str(self.cache_dir / "analyses")) as db:
+                db[key] = findings
+        except Exception as e:
+            logger.warning(f"Could not write analysis cache: {e}")
+
+    def _remember(self, key: str, findings: List[Finding]) -> None:
+        """Add findings to the in-memory LRU cache."""
+        self._cache[key] = list(findings)
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.CACHE_MAXSIZE:
+            self._cache.popitem(last=False)
+
+    def _prepare(
+        self, code: str, language: str, file_name: str, analysis_type: str
+    ) -> Tuple[Optional[List[Finding]], Optional[str], Optional[Dict[str, Any]]]:
+        """Check a single-file analysis against empty input and the cache.
+
+        Returns:
+            (findings, key, request): findings is set when no API call is
+            needed; otherwise request holds the messages.stream arguments and
+            key the cache key (None with caching off)
+        """
+        if not code or not code.strip():
+            logger.warning(f"Empty code provided for {file_name}")
+            return [], None, None
+
+        key = None
+        if self.use_cache:
+            key = self._cache_key(code, language, file_name, analysis_type)
+            cached = self._cache_get(key)
+            if cached is not None:
+                logger.info("Using cached analysis for %s", file_name)
+                return cached, key, None
+
+        request = self._build_request(get_prompt(analysis_type, file_name, code, language))
+        return None, key, request
+
+    def _complete(
+        self, key: Optional[str], response_text: Optional[str], file_name: str
+    ) -> List[Finding]:
+        """Parse a single-file response, caching it when it parsed."""
+        if response_text is None:
+            return []
+
+        findings = self._handle_response(response_text, file_name)
+        if findings is None:
+            return []
+        if key is not None:
+            self._cache_put(key, findings)
         return findings
 
     def analyze_code(
@@ -159,6 +541,10 @@ class CodeAnalyzer:
     ) -> List[Finding]:
         """Analyze code using Claude API.
 
+        Results are cached by prompt version, model, language, analysis type,
+        file name and code, so unchanged files are not sent to the API again.
+        Failed requests and unparseable responses are not cached.
+
         Args:
             code: Source code to analyze
             language: Programming language
@@ -168,53 +554,197 @@ class CodeAnalyzer:
         Returns:
             List of Finding objects
         """
-        if not code or not code.strip():
-            logger.warning(f"Empty code provided for {file_name}")
-            return []
+        findings, key, request = self._prepare(code, language, file_name, analysis_type)
+        if findings is not None:
+            return findings
+        return self._complete(key, self._stream_text(request, file_name), file_name)
 
-        # Get prompt
-        prompt = get_prompt(analysis_type, file_name, code, language)
+    async def analyze_code_async(
+        self,
+        code: str,
+        language: str,
+        file_name: str = "unknown",
+        analysis_type: str = "comprehensive",
+    ) -> List[Finding]:
+        """Analyze code using the async Claude API client.
 
-        # Call Claude API with retries
-        for attempt in range(self.max_retries):
+        Same behaviour as analyze_code(), but waits on the network (and on
+        retry backoff) without blocking the event loop.
+
+        Args:
+            code: Source code to analyze
+            language: Programming language
+            file_name: Name of the file
+            analysis_type: Type of analysis (security, bugs, quality, comprehensive)
+
+        Returns:
+            List of Finding objects
+        """
+        findings, key, request = self._prepare(code, language, file_name, analysis_type)
+        if findings is not None:
+            return findings
+        return self._complete(key, await self._stream_text_async(request, file_name), file_name)
+
+    async def _with_async_client(self, func, *args, **kwargs):
+        """Await func(*args, **kwargs) with an async client for this event loop.
+
+        Each asyncio.run() call starts a new loop, so the sync wrappers open
+        a fresh client per run and close it when the run finishes.
+        """
+        async with AsyncAnthropic(api_key=self.api_key) as client:
+            token = _ASYNC_CLIENT.set(client)
             try:
-                response = self.client.messages.create(
-                    model=self.model,
-                    max_tokens=4096,
-                    messages=[
-                        {
-                            "role": "user",
-                            "content": prompt,
-                        }
-                    ],
-                    timeout=self.timeout,
-                )
+                return await func(*args, **kwargs)
+            finally:
+                _ASYNC_CLIENT.reset(token)
+
+    def analyze_batch(
+        self,
+        files: List[Dict[str, Any]],
+        analysis_type: str = "comprehensive",
+    ) -> Dict[str, List[Finding]]:
+        """Analyze several files with a single API request.
+
+        Runs analyze_batch_async() to completion; must not be called from
+        inside a running event loop.
+
+        Args:
+            files: File data dicts as returned by CodeParser.analyze_file
+            analysis_type: Type of analysis
+
+        Returns:
+            Mapping of file path to its findings, in input order
+        """
+        return asyncio.run(
+            self._with_async_client(self.analyze_batch_async, files, analysis_type=analysis_type)
+        )
 
-                # Extract text from response
-                if hasattr(response, "content") and response.content:
-                    response_text = response.content[0].text
+    async def analyze_batch_async(
+        self,
+        files: List[Dict[str, Any]],
+        analysis_type: str = "comprehensive",
+    ) -> Dict[str, List[Finding]]:
+        """Analyze several files with a single API request.
+
+        Files with cached results are not sent again. Findings in the
+        response are routed to their file by the "file_name" each one
+        carries. If the response cannot be parsed (for example because it
+        hit max_tokens) or a finding cannot be matched to exactly one file,
+        each file is analyzed on its own instead.
+
+        Args:
+            files: File data dicts as returned by CodeParser.analyze_file
+            analysis_type: Type of analysis
+
+        Returns:
+            Mapping of file path to its findings, in input order
+        """
+        results: Dict[str, List[Finding]] = {}
+        pending = []
+
+        for file_data in files:
+            path, code = file_data["path"], file_data["content"]
+            if not code or not code.strip():
+                results[path] = []
+                continue
+
+            key = None
+            if self.use_cache:
+                key = self._cache_key(code, file_data["language"], path, analysis_type)
+                cached = self._cache_get(key)
+                if cached is not None:
+                    logger.info("Using cached analysis for %s", path)
+                    results[path] = cached
+                    continue
+            pending.append((file_data, key))
+
+        if len(pending) == 1:
+            file_data = pending[0][0]
+            results[file_data["path"]] = await self.analyze_code_async(
+                code=file_data["content"],
+                language=file_data["language"],
+                file_name=file_data["path"],
+                analysis_type=analysis_type,
+            )
+        elif pending:
+            label = f"batch of {len(pending)} files"
+            prompt = get_batch_prompt(analysis_type, [file_data for file_data, _ in pending])
+            request = self._build_request(prompt, files=len(pending))
+            response_text = await self._stream_text_async(request, label)
+
+            by_path: Optional[Dict[str, List[Finding]]] = None
+            if response_text:
+                # A response cut off at max_tokens does not parse either
+                findings = self._parse_findings(response_text, None)
+                if findings is not None:
+                    by_path = self._route_findings(
+                        findings, [file_data["path"] for file_data, _ in pending]
+                    )
+                if by_path is None:
+                    logger.warning(f"Could not use the response for {label}; analyzing each file")
+                    per_file = await asyncio.gather(
+                        *(
+                            self.analyze_code_async(
+                                code=file_data["content"],
+                                language=file_data["language"],
+                                file_name=file_data["path"],
+                                analysis_type=analysis_type,
+                            )
+                            for file_data, _ in pending
+                        )
+                    )
+                    by_path = {
+                        file_data["path"]: file_findings
+                        for (file_data, _), file_findings in zip(pending, per_file)
+                    }
                 else:
+                    logger.info("Analysis complete for %s: %d findings", label, len(findings))
+                    for file_data, key in pending:
+                        if key is not None:
+                            self._cache_put(key, by_path[file_data["path"]])
+            else:
+                if response_text is not None:
                     logger.error("Empty response from Claude API")
-                    return []
+                by_path = {file_data["path"]: [] for file_data, _ in pending}
 
-                # Parse findings
-                findings = self._parse_api_response(response_text, file_name)
-                logger.info(
-                    f"Analysis complete for {file_name}: {len(findings)} findings"
-                )
-                return findings
+            results.update(by_path)
 
-            except Exception as e:
-                logger.error(
-                    f"Error calling Claude API (attempt {attempt + 1}/{self.max_retries}): {e}"
-                )
-                if attempt < self.max_retries - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
-                else:
-                    logger.error(f"Failed to analyze {file_name} after {self.max_retries} attempts")
-                    return []
+        return {file_data["path"]: results[file_data["path"]] for file_data in files}
+
+    def _route_findings(
+        self, findings: List[Finding], paths: List[str]
+    ) -> Optional[Dict[str, List[Finding]]]:
+        """Assign batched findings to the files they name.
 
-        return []
+        A finding matches a path exactly, or by basename when only one file
+        in the batch has that basename.
+
+        Args:
+            findings: Findings parsed from a batched response
+            paths: Paths of the files in the batch
+
+        Returns:
+            Mapping of path to findings, or None if any finding names no
+            file, an unknown file or an ambiguous basename
+        """
+        by_path: Dict[str, List[Finding]] = {path: [] for path in paths}
+        by_name: Dict[str, Optional[str]] = {}
+        for path in paths:
+            name = os.path.basename(path)
+            by_name[name] = None if name in by_name else path
+
+        for finding in findings:
+            path = finding.location.file_path
+            if path not in by_path:
+                path = by_name.get(os.path.basename(path)) if path else None
+                if path is None:
+                    logger.warning(
+                        f"Cannot match finding to a file: {finding.location.file_path!r}"
+                    )
+                    return None
+                finding.location.file_path = path
+            by_path[path].append(finding)
+        return by_path
 
     def analyze_directory(
         self,
@@ -224,6 +754,96 @@ class CodeAnalyzer:
     ) -> AnalysisResult:
         """Analyze all files in a directory.
 
+        Runs analyze_directory_async() to completion; must not be called from
+        inside a running event loop.
+
+        Args:
+            directory: Directory path to analyze
+            analysis_type: Type of analysis
+            parser: CodeParser instance (will create if not provided)
+
+        Returns:
+            AnalysisResult with all findings
+        """
+        return asyncio.run(
+            self._with_async_client(
+                self.analyze_directory_async, directory, analysis_type=analysis_type, parser=parser
+            )
+        )
+
+    def analyze_files_data(
+        self,
+        files_data: List[Dict[str, Any]],
+        analysis_type: str = "comprehensive",
+        directory: Optional[str] = None,
+    ) -> AnalysisResult:
+        """Analyze files that were already read.
+
+        Runs analyze_files_data_async() to completion; must not be called from
+        inside a running event loop.
+
+        Args:
+            files_data: File data dicts as returned by CodeParser.analyze_files
+            analysis_type: Type of analysis
+            directory: Directory the files came from, recorded in the metadata
+
+        Returns:
+            AnalysisResult with all findings
+        """
+        return asyncio.run(
+            self._with_async_client(
+                self.analyze_files_data_async,
+                files_data,
+                analysis_type=analysis_type,
+                directory=directory,
+            )
+        )
+
+    @staticmethod
+    def _file_size(file_path: str) -> int:
+        """Size of a file in bytes, or 0 if it cannot be read."""
+        try:
+            return os.path.getsize(file_path)
+        except OSError:
+            return 0
+
+    def _group_files(
+        self, files: List[str], size_of: Optional[Callable[[str], int]] = None
+    ) -> List[List[str]]:
+        """Group file paths into batches of at most BATCH_MAX_FILES files and
+        roughly BATCH_MAX_BYTES bytes, keeping their order."""
+        size_of = size_of or self._file_size
+        batches: List[List[str]] = []
+        batch: List[str] = []
+        batch_bytes = 0
+
+        for file_path in files:
+            size = size_of(file_path)
+
+            if batch and (
+                len(batch) >= self.BATCH_MAX_FILES or batch_bytes + size > self.BATCH_MAX_BYTES
+            ):
+                batches.append(batch)
+                batch, batch_bytes = [], 0
+            batch.append(file_path)
+            batch_bytes += size
+
+        if batch:
+            batches.append(batch)
+        return batches
+
+    async def analyze_directory_async(
+        self,
+        directory: str,
+        analysis_type: str = "comprehensive",
+        parser=None,
+    ) -> AnalysisResult:
+        """Analyze all files in a directory concurrently.
+
+        Small files are packed into batches (see analyze_batch_async), and up
+        to ANALYZER_CONCURRENCY batches (default 8) are read and sent to the
+        API at a time. Findings keep the order of the file list.
+
         Args:
             directory: Directory path to analyze
             analysis_type: Type of analysis
@@ -238,40 +858,105 @@ class CodeAnalyzer:
             parser = CodeParser()
 
         start_time = time.time()
-        all_findings = []
-        files_analyzed = 0
-        total_lines = 0
 
         # Get files to analyze
         files = parser.get_files_to_analyze(directory)
         logger.info(f"Found {len(files)} files to analyze")
 
-        # Analyze each file
-        for file_path in files:
-            try:
-                file_data = parser.analyze_file(file_path)
-                if not file_data:
-                    continue
+        async def read(batch: List[str]) -> List[Dict[str, Any]]:
+            # Read the batch in threads, off the event loop
+            return await asyncio.to_thread(parser.analyze_files, batch)
 
-                findings = self.analyze_code(
-                    code=file_data["content"],
-                    language=file_data["language"],
-                    file_name=file_data["path"],
-                    analysis_type=analysis_type,
-                )
+        return await self._analyze_batches(
+            self._group_files(files), read, analysis_type, start_time, {"directory": directory}
+        )
+
+    async def analyze_files_data_async(
+        self,
+        files_data: List[Dict[str, Any]],
+        analysis_type: str = "comprehensive",
+        directory: Optional[str] = None,
+    ) -> AnalysisResult:
+        """Analyze files that were already read, concurrently.
+
+        Batches like analyze_directory_async() but takes the file data from
+        the caller, so one read of each file can serve other passes too.
+
+        Args:
+            files_data: File data dicts as returned by CodeParser.analyze_files
+            analysis_type: Type of analysis
+            directory: Directory the files came from, recorded in the metadata
+
+        Returns:
+            AnalysisResult with all findings
+        """
+        start_time = time.time()
+        by_path = {file_data["path"]: file_data for file_data in files_data}
+        batches = self._group_files(list(by_path), lambda path: by_path[path]["size_bytes"])
+
+        async def read(batch: List[str]) -> List[Dict[str, Any]]:
+            return [by_path[path] for path in batch]
+
+        metadata = {} if directory is None else {"directory": directory}
+        return await self._analyze_batches(batches, read, analysis_type, start_time, metadata)
 
+    async def _analyze_batches(
+        self,
+        batches: List[List[str]],
+        read: Callable[[List[str]], Awaitable[List[Dict[str, Any]]]],
+        analysis_type: str,
+        start_time: float,
+        metadata: Dict[str, Any],
+    ) -> AnalysisResult:
+        """Load and analyze batches of files concurrently.
+
+        Args:
+            batches: Batches of file paths, as built by _group_files()
+            read: Coroutine function returning the file data for a batch
+            analysis_type: Type of analysis
+            start_time: When the analysis started, for the elapsed time
+            metadata: Extra result metadata
+
+        Returns:
+            AnalysisResult with all findings, in batch order
+        """
+        all_findings = []
+        files_analyzed = 0
+        total_lines = 0
+        semaphore = asyncio.Semaphore(int(os.getenv("ANALYZER_CONCURRENCY", "8")))
+
+        async def analyze_files(batch: List[str]):
+            async with semaphore:
+                files_data = await read(batch)
+                if not files_data:
+                    return []
+                findings_by_path = await self.analyze_batch_async(files_data, analysis_type)
+
+            if logger.isEnabledFor(logging.INFO):
+                for file_data in files_data:
+                    logger.info(
+                        "Analyzed %s: %d findings, %d lines",
+                        file_data["path"],
+                        len(findings_by_path[file_data["path"]]),
+                        file_data["line_count"],
+                    )
+            return [(d, findings_by_path[d["path"]]) for d in files_data]
+
+        # Analyze each batch
+        results = await asyncio.gather(
+            *(analyze_files(batch) for batch in batches), return_exceptions=True
+        )
+
+        for batch, result in zip(batches, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error analyzing files {', '.join(batch)}: {result}")
+                continue
+
+            for file_data, findings in result:
                 all_findings.extend(findings)
                 files_analyzed += 1
                 total_lines += file_data["line_count"]
 
-                logger.info(
-                    f"Analyzed {file_path}: {len(findings)} findings, "
-                    f"{file_data['line_count']} lines"
-                )
-
-            except Exception as e:
-                logger.error(f"Error analyzing file {file_path}: {e}")
-
         analysis_time = time.time() - start_time
 
         return AnalysisResult(
@@ -280,9 +965,8 @@ class CodeAnalyzer:
             total_lines=total_lines,
             analysis_time_seconds=analysis_time,
             metadata={
-                "directory": directory,
+                **metadata,
                 "analysis_type": analysis_type,
                 "model": self.model,
             },
         )
-
@@ -1,10 +1,20 @@
 """Data structures for analysis findings."""
 
+import json
+from collections import Counter
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+# Two-space indent like json.dumps(..., indent=2); metadata may carry non-str keys
+_ORJSON_OPTIONS = (orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
 
 class FindingType(str, Enum):
     """Types of findings that can be detected."""
@@ -17,16 +27,25 @@ class FindingType(str, Enum):
 
 
 class Severity(str, Enum):
-    """Severity levels for findings."""
+    """Severity levels for findings.
+
+    Each member also carries an ``order`` rank, 0 for the most severe.
+    """
 
-    CRITICAL = "critical"
-    HIGH = "high"
-    MEDIUM = "medium"
-    LOW = "low"
-    INFO = "info"
+    CRITICAL = ("critical", 0)
+    HIGH = ("high", 1)
+    MEDIUM = ("medium", 2)
+    LOW = ("low", 3)
+    INFO = ("info", 4)
 
+    def __new__(cls, value: str, order: int):
+        member = str.__new__(cls, value)
+        member._value_ = value
+        member.order = order
+        return member
 
-@dataclass
+
+@dataclass(slots=True)
 class Location:
     """Location of a finding in source code."""
 
@@ -47,7 +66,7 @@ class Location:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Finding:
     """A single finding from code analysis."""
 
@@ -64,8 +83,9 @@ class Finding:
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
-            "type": self.type.value,
-            "severity": self.severity.value,
+            # _value_ is the plain attribute behind the .value property
+            "type": self.type._value_,
+            "severity": self.severity._value_,
             "message": self.message,
             "location": self.location.to_dict(),
             "remediation": self.remediation,
@@ -77,12 +97,14 @@ class Finding:
 
     def to_json(self) -> str:
         """Convert to JSON string."""
-        import json
+        if orjson is not None:
+            # Serialized straight from the dataclass; field order matches to_dict()
+            return orjson.dumps(self, option=_ORJSON_OPTIONS).decode()
 
         return json.dumps(self.to_dict(), indent=2)
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     """Result of analyzing code."""
 
@@ -103,17 +125,11 @@ class AnalysisResult:
 
     def get_summary(self) -> Dict[str, Any]:
         """Get summary statistics."""
-        findings_by_severity = {}
-        for severity in Severity:
-            findings_by_severity[severity.value] = len(
-                self.get_findings_by_severity(severity)
-            )
-
-        findings_by_type = {}
-        for finding_type in FindingType:
-            findings_by_type[finding_type.value] = len(
-                self.get_findings_by_type(finding_type)
-            )
+        # One pass over the findings for each breakdown
+        severity_counts = Counter(f.severity for f in self.findings)
+        type_counts = Counter(f.type for f in self.findings)
+        findings_by_severity = {s.value: severity_counts[s] for s in Severity}
+        findings_by_type = {t.value: type_counts[t] for t in FindingType}
 
         return {
             "total_findings": len(self.findings),
@@ -135,7 +151,22 @@ class AnalysisResult:
 
     def to_json(self) -> str:
         """Convert to JSON string."""
-        import json
+        if orjson is not None:
+            return self.to_json_bytes().decode()
 
         return json.dumps(self.to_dict(), indent=2)
 
+    def to_json_bytes(self) -> bytes:
+        """Convert to UTF-8 encoded JSON, the same document as to_json()."""
+        if orjson is not None:
+            # Same document as to_dict(), but the findings are handed to
+            # orjson as dataclasses instead of being copied into dicts first
+            document = {
+                "findings": self.findings,
+                "summary": self.get_summary(),
+                "metadata": self.metadata,
+            }
+            return orjson.dumps(document, option=_ORJSON_OPTIONS)
+
+        return self.to_json().encode("utf-8")
+
@@ -1,14 +1,24 @@
 """Logging configuration for production."""
 
 import os
-import logging
 import sys
-from logging.handlers import RotatingFileHandler
+import queue
+import atexit
+import logging
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
+# Background thread that writes queued records to the log file
+_file_listener = None
+
 
 def setup_logging(log_level: str = None, log_file: str = "app.log"):
-    """Setup production logging configuration."""
+    """Setup production logging configuration.
+
+    File writes happen on a QueueListener thread; logging calls only
+    enqueue the record for the file handler.
+    """
+    global _file_listener
     
     # Get log level from environment or default
     level = getattr(logging, (log_level or os.getenv("LOG_LEVEL", "INFO")).upper())
@@ -23,6 +33,9 @@ def setup_logging(log_level: str = None, log_file: str = "app.log"):
     
     # Clear existing handlers
     root_logger.handlers.clear()
+    if _file_listener is not None:
+        _file_listener.stop()
+        _file_listener = None
     
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
@@ -47,7 +60,13 @@ def setup_logging(log_level: str = None, log_file: str = "app.log"):
         datefmt="%Y-%m-%d %H:%M:%S"
     )
     file_handler.setFormatter(file_format)
-    root_logger.addHandler(file_handler)
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setLevel(level)
+    root_logger.addHandler(queue_handler)
+    _file_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _file_listener.start()
     
     # Set levels for third-party libraries
     logging.getLogger("uvicorn").setLevel(logging.WARNING)
@@ -56,3 +75,12 @@ def setup_logging(log_level: str = None, log_file: str = "app.log"):
     
     return root_logger
 
+
+def _stop_file_listener():
+    """Flush queued records to the log file at interpreter exit."""
+    if _file_listener is not None:
+        _file_listener.stop()
+
+
+atexit.register(_stop_file_listener)
+
@@ -1,53 +1,71 @@
 """Monitoring and metrics collection."""
 
 import time
+import heapq
+from array import array
 import logging
-from typing import Dict, Any, Optional
-from datetime import datetime
-from collections import defaultdict
+from typing import Dict, Any, Optional, Sequence
+from collections import Counter, defaultdict
 
 logger = logging.getLogger(__name__)
 
 
+def _percentile_95(durations: Sequence[float]) -> float:
+    """Return the value at index int(n * 0.95) of the sorted durations.
+
+    Only the top 5% is ordered (heapq.nlargest) instead of sorting the
+    whole list.
+    """
+    k = len(durations) - int(len(durations) * 0.95)
+    return heapq.nlargest(k, durations)[-1]
+
+
 class MetricsCollector:
     """Collect and track metrics."""
 
     def __init__(self):
-        self.metrics = defaultdict(list)
+        # Timing samples stored column-wise: one array per field, no dict per sample
+        self.metrics = defaultdict(
+            lambda: {"values": array("d"), "timestamps": array("d"), "tags": []}
+        )
         self.counters = defaultdict(int)
         self.start_time = time.time()
 
     def record_timing(self, metric_name: str, duration: float, tags: Optional[Dict[str, str]] = None):
         """Record timing metric."""
-        self.metrics[metric_name].append({
-            "value": duration,
-            "timestamp": datetime.utcnow().isoformat(),
-            "tags": tags or {},
-        })
+        samples = self.metrics[metric_name]
+        samples["values"].append(duration)
+        # Epoch seconds; formatting is left to whoever reads the sample
+        samples["timestamps"].append(time.time())
+        samples["tags"].append(tags)
 
     def increment_counter(self, counter_name: str, value: int = 1, tags: Optional[Dict[str, str]] = None):
         """Increment counter metric."""
-        key = f"{counter_name}:{tags or {}}"
+        # Tags kept in insertion order, like the "name:{tags}" labels built from them
+        key = (counter_name, tuple(tags.items()) if tags else ())
         self.counters[key] += value
 
     def get_metrics_summary(self) -> Dict[str, Any]:
         """Get summary of all metrics."""
         summary = {
             "uptime_seconds": time.time() - self.start_time,
-            "counters": dict(self.counters),
+            "counters": {
+                f"{name}:{dict(tags)}": count for (name, tags), count in self.counters.items()
+            },
             "timings": {},
         }
 
         # Calculate timing statistics
-        for metric_name, values in self.metrics.items():
-            if values:
-                durations = [v["value"] for v in values]
+        for metric_name, samples in self.metrics.items():
+            durations = samples["values"]
+            if durations:
+                count = len(durations)
                 summary["timings"][metric_name] = {
-                    "count": len(durations),
+                    "count": count,
                     "min": min(durations),
                     "max": max(durations),
-                    "avg": sum(durations) / len(durations),
-                    "p95": sorted(durations)[int(len(durations) * 0.95)] if durations else 0,
+                    "avg": sum(durations) / count,
+                    "p95": _percentile_95(durations),
                 }
 
         return summary
@@ -83,24 +101,18 @@ class PerformanceMonitor:
 
 def log_analysis_metrics(result, analysis_type: str, language: str):
     """Log metrics for analysis operation."""
-    metrics.increment_counter("analyses_total", tags={"type": analysis_type, "language": language})
+    # Tag dicts are only read by the collector, so one of each is shared
+    analysis_tags = {"type": analysis_type, "language": language}
+    type_tags = {"type": analysis_type}
+
+    metrics.increment_counter("analyses_total", tags=analysis_tags)
     metrics.increment_counter("findings_total", value=len(result.findings))
     metrics.increment_counter("files_analyzed", value=result.files_analyzed)
 
     # Record timing
-    metrics.record_timing(
-        "analysis_duration",
-        result.analysis_time_seconds,
-        tags={"type": analysis_type, "language": language},
-    )
-
-    # Record findings by severity
-    for severity in ["critical", "high", "medium", "low", "info"]:
-        count = len([f for f in result.findings if f.severity.value == severity])
-        if count > 0:
-            metrics.increment_counter(
-                f"findings_{severity}",
-                value=count,
-                tags={"type": analysis_type},
-            )
+    metrics.record_timing("analysis_duration", result.analysis_time_seconds, tags=analysis_tags)
 
+    # Record findings by severity; counted by member so .value is read
+    # once per severity rather than once per finding
+    for severity, count in Counter(f.severity for f in result.findings).items():
+        metrics.increment_counter(f"findings_{severity.value}", value=count, tags=type_tags)
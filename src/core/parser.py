@@ -1,9 +1,11 @@
 """Code parser for language detection and file extraction."""
 
 import os
-import chardet
+import stat
+import codecs
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Iterator, List, Dict, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -79,6 +81,11 @@ IGNORE_PATTERNS = {
     "*.min.css",
 }
 
+# IGNORE_PATTERNS split by kind: plain names are matched against path
+# components, "*" patterns against the end of file names
+IGNORE_DIRS = frozenset(p for p in IGNORE_PATTERNS if "*" not in p)
+IGNORE_SUFFIXES = tuple(p.replace("*", "") for p in IGNORE_PATTERNS if "*" in p)
+
 
 class CodeParser:
     """Parser for extracting code from files and detecting languages."""
@@ -100,7 +107,8 @@ class CodeParser:
         Returns:
             Language name or None if not supported
         """
-        ext = Path(file_path).suffix.lower()
+        # splitext avoids building a Path just to read the extension
+        ext = os.path.splitext(file_path)[1].lower()
         return LANGUAGE_EXTENSIONS.get(ext)
 
     def should_analyze_file(self, file_path: str) -> bool:
@@ -112,61 +120,112 @@ class CodeParser:
         Returns:
             True if file should be analyzed
         """
-        path = Path(file_path)
+        # Check if file exists (a single stat covers existence, type and size)
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return False
+        if not stat.S_ISREG(st.st_mode):
+            return False
 
-        # Check if file exists
-        if not path.exists() or not path.is_file():
+        if self._in_ignored_directory(os.path.dirname(file_path)):
             return False
 
+        return self._is_candidate(file_path, st.st_size, os.path.basename(file_path))
+
+    def _in_ignored_directory(self, directory: str) -> bool:
+        """Check whether any component of a directory path is ignored.
+
+        Args:
+            directory: Directory path
+
+        Returns:
+            True if the directory is, or is inside, an ignored directory
+        """
+        return not IGNORE_DIRS.isdisjoint(Path(directory).parts)
+
+    def _is_candidate(self, file_path: str, size_bytes: int, name: str) -> bool:
+        """Apply size, ignore-pattern and language checks to an existing file.
+
+        Only the file name is checked against the ignore patterns; callers
+        are responsible for the directories above it.
+
+        Args:
+            file_path: Path to the file
+            size_bytes: File size in bytes
+            name: Base name of the file
+
+        Returns:
+            True if file should be analyzed
+        """
         # Check file size
-        size_kb = path.stat().st_size / 1024
+        size_kb = size_bytes / 1024
         if size_kb > self.max_file_size_kb:
             logger.warning(f"File {file_path} too large ({size_kb:.1f}KB), skipping")
             return False
 
         # Check ignore patterns
-        for pattern in IGNORE_PATTERNS:
-            if pattern in path.parts or path.name.endswith(pattern.replace("*", "")):
-                return False
+        if name in IGNORE_DIRS or name.endswith(IGNORE_SUFFIXES):
+            return False
 
         # Check if language is supported
-        if not self.detect_language(str(file_path)):
+        if not self.detect_language(name):
             return False
 
         return True
 
-    def read_file(self, file_path: str) -> Tuple[Optional[str], Optional[str]]:
+    def read_file(self, file_path: str) -> Tuple[Optional[str], Optional[str], int]:
         """Read file content with encoding detection.
 
         Args:
             file_path: Path to the file
 
         Returns:
-            Tuple of (content, encoding) or (None, None) on error
+            Tuple of (content, encoding, size_bytes) or (None, None, 0) on error
         """
         try:
-            path = Path(file_path)
-
-            # Try to detect encoding
-            with open(path, "rb") as f:
+            with open(file_path, "rb") as f:
                 raw_data = f.read()
-                result = chardet.detect(raw_data)
-                encoding = result.get("encoding", "utf-8")
-
-            # Read with detected encoding, fallback to utf-8
-            try:
-                with open(path, "r", encoding=encoding, errors="replace") as f:
-                    content = f.read()
-                return content, encoding
-            except (UnicodeDecodeError, LookupError):
-                # Fallback to utf-8
-                with open(path, "r", encoding="utf-8", errors="replace") as f:
-                    content = f.read()
-                return content, "utf-8"
+
+            content, encoding = self._decode(raw_data)
+
+            # Match text-mode reads, which translate \r\n and \r to \n
+            if "\r" in content:
+                content = content.replace("\r\n", "\n").replace("\r", "\n")
+            return content, encoding, len(raw_data)
 
         except Exception as e:
             logger.error(f"Error reading file {file_path}: {e}")
-            return None, None
+            return None, None, 0
+
+    def _decode(self, raw_data: bytes) -> Tuple[str, str]:
+        """Decode file bytes, trying UTF-8 before encoding detection.
+
+        Args:
+            raw_data: File content
+
+        Returns:
+            Tuple of (content, encoding)
+        """
+        # Nearly all source files are UTF-8 or ASCII, so try that first and
+        # only run the much slower chardet scan when it fails
+        try:
+            if raw_data.startswith(codecs.BOM_UTF8):
+                return raw_data.decode("utf-8-sig"), "utf-8-sig"
+            return raw_data.decode("utf-8"), "utf-8"
+        except UnicodeDecodeError:
+            pass
+
+        # chardet builds large probers on import, so it is only loaded when
+        # a file is not UTF-8
+        import chardet
+
+        encoding = chardet.detect(raw_data).get("encoding") or "utf-8"
+        try:
+            return raw_data.decode(encoding, errors="replace"), encoding
+        except LookupError:
+            # Fallback to utf-8
+            return raw_data.decode("utf-8", errors="replace"), "utf-8"
 
     def analyze_file(self, file_path: str) -> Optional[Dict[str, any]]:
         """Analyze a single file and extract code.
@@ -184,7 +243,7 @@ class CodeParser:
         if not language:
             return None
 
-        content, encoding = self.read_file(file_path)
+        content, encoding, size_bytes = self.read_file(file_path)
         if content is None:
             return None
 
@@ -193,10 +252,31 @@ class CodeParser:
             "language": language,
             "content": content,
             "encoding": encoding,
-            "size_bytes": len(content.encode(encoding or "utf-8")),
-            "line_count": len(content.splitlines()),
+            "size_bytes": size_bytes,
+            # Count newlines rather than building a list of lines
+            "line_count": content.count("\n") + (bool(content) and not content.endswith("\n")),
         }
 
+    def analyze_files(self, file_paths: List[str]) -> List[Dict[str, any]]:
+        """Analyze several files concurrently.
+
+        File reads release the GIL, so a thread pool lets disk and page
+        cache latency overlap across files.
+
+        Args:
+            file_paths: Paths to the files
+
+        Returns:
+            File info dictionaries, in input order, for the files that
+            could be analyzed
+        """
+        if not file_paths:
+            return []
+
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(file_paths))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return [data for data in executor.map(self.analyze_file, file_paths) if data]
+
     def get_files_to_analyze(self, directory: str) -> List[str]:
         """Get list of files to analyze from directory.
 
@@ -219,15 +299,43 @@ class CodeParser:
                 files.append(str(path))
             return files
 
-        # Walk directory
-        for root, dirs, filenames in os.walk(path):
-            # Filter out ignored directories
-            dirs[:] = [d for d in dirs if d not in IGNORE_PATTERNS]
+        if self._in_ignored_directory(str(path)):
+            return files
 
-            for filename in filenames:
-                file_path = os.path.join(root, filename)
-                if self.should_analyze_file(file_path):
-                    files.append(file_path)
+        # Walk directory; ignored directories are pruned by _walk, so only
+        # the entry's own name needs checking
+        for entry in self._walk(str(path)):
+            # DirEntry caches its stat result, so size costs one syscall
+            if self._is_candidate(entry.path, entry.stat().st_size, entry.name):
+                files.append(entry.path)
 
         return files
 
+    def _walk(self, directory: str) -> Iterator[os.DirEntry]:
+        """Yield file entries under a directory, skipping ignored directories.
+
+        Files in a directory are yielded before descending into its
+        subdirectories, matching os.walk's top-down order. Symlinked
+        directories are not followed.
+
+        Args:
+            directory: Directory to scan
+
+        Yields:
+            DirEntry for each regular file (or symlink to one)
+        """
+        subdirs = []
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in IGNORE_DIRS:
+                            subdirs.append(entry.path)
+                    elif entry.is_file():
+                        yield entry
+        except OSError as e:
+            logger.warning(f"Cannot scan directory {directory}: {e}")
+            return
+
+        for subdir in subdirs:
+            yield from self._walk(subdir)
@@ -1,26 +1,18 @@
 """Prompts for Claude API analysis."""
 
-from typing import Dict, Optional
+import hashlib
+from typing import Any, Dict, List, Optional
 
+# Prompt bodies are filled with %-formatting, in argument order:
+# language, file_name, language, code
 
-def get_security_prompt(file_name: str, code: str, language: str) -> str:
-    """Get security vulnerability analysis prompt.
+_SECURITY_TEMPLATE = """Analyze the following %s code for security vulnerabilities.
 
-    Args:
-        file_name: Name of the file being analyzed
-        code: Source code content
-        language: Programming language
-
-    Returns:
-        Formatted prompt string
-    """
-    return f"""Analyze the following {language} code for security vulnerabilities.
-
-File: {file_name}
+File: %s
 
 Code:
-```{language}
-{code}
+```%s
+%s
 ```
 
 Please identify:
@@ -44,42 +36,31 @@ For each vulnerability found, provide:
 - Confidence: Your confidence level (0.0 to 1.0)
 
 Format your response as JSON with this structure:
-{{
+{
   "findings": [
-    {{
+    {
       "type": "SECURITY",
       "severity": "critical",
       "line": 42,
       "message": "SQL injection vulnerability: user input directly concatenated into SQL query",
       "remediation": "Use parameterized queries or prepared statements",
       "confidence": 0.95,
-      "code_snippet": "query = f'SELECT * FROM users WHERE id = {{user_input}}'"  # Example: SQL injection pattern (for demonstration)
-    }}
+      "code_snippet": "query = f'SELECT * FROM users WHERE id = {user_input}'"  # Example: SQL injection pattern (for demonstration)
+    }
   ]
-}}
+}
 
-If no vulnerabilities are found, return: {{"findings": []}}
+If no vulnerabilities are found, return: {"findings": []}
 """
 
 
-def get_bug_detection_prompt(file_name: str, code: str, language: str) -> str:
-    """Get bug detection prompt.
-
-    Args:
-        file_name: Name of the file being analyzed
-        code: Source code content
-        language: Programming language
-
-    Returns:
-        Formatted prompt string
-    """
-    return f"""Analyze the following {language} code for bugs and logic errors.
+_BUG_DETECTION_TEMPLATE = """Analyze the following %s code for bugs and logic errors.
 
-File: {file_name}
+File: %s
 
 Code:
-```{language}
-{code}
+```%s
+%s
 ```
 
 Please identify:
@@ -103,9 +84,9 @@ For each bug found, provide:
 - Confidence: Your confidence level (0.0 to 1.0)
 
 Format your response as JSON with this structure:
-{{
+{
   "findings": [
-    {{
+    {
       "type": "BUG",
       "severity": "high",
       "line": 15,
@@ -113,32 +94,21 @@ Format your response as JSON with this structure:
       "remediation": "Add null check before accessing user properties",
       "confidence": 0.85,
       "code_snippet": "name = user.name"
-    }}
+    }
   ]
-}}
+}
 
-If no bugs are found, return: {{"findings": []}}
+If no bugs are found, return: {"findings": []}
 """
 
 
-def get_quality_prompt(file_name: str, code: str, language: str) -> str:
-    """Get code quality analysis prompt.
+_QUALITY_TEMPLATE = """Analyze the following %s code for code quality issues.
 
-    Args:
-        file_name: Name of the file being analyzed
-        code: Source code content
-        language: Programming language
-
-    Returns:
-        Formatted prompt string
-    """
-    return f"""Analyze the following {language} code for code quality issues.
-
-File: {file_name}
+File: %s
 
 Code:
-```{language}
-{code}
+```%s
+%s
 ```
 
 Please identify:
@@ -162,9 +132,9 @@ For each issue found, provide:
 - Confidence: Your confidence level (0.0 to 1.0)
 
 Format your response as JSON with this structure:
-{{
+{
   "findings": [
-    {{
+    {
       "type": "QUALITY",
       "severity": "medium",
       "line": 50,
@@ -172,32 +142,21 @@ Format your response as JSON with this structure:
       "remediation": "Extract logical sections into separate methods",
       "confidence": 0.90,
       "code_snippet": "def process_data(): ..."
-    }}
+    }
   ]
-}}
+}
 
-If no issues are found, return: {{"findings": []}}
+If no issues are found, return: {"findings": []}
 """
 
 
-def get_comprehensive_prompt(file_name: str, code: str, language: str) -> str:
-    """Get comprehensive analysis prompt (security + bugs + quality).
+_COMPREHENSIVE_TEMPLATE = """Perform a comprehensive analysis of the following %s code.
 
-    Args:
-        file_name: Name of the file being analyzed
-        code: Source code content
-        language: Programming language
-
-    Returns:
-        Formatted prompt string
-    """
-    return f"""Perform a comprehensive analysis of the following {language} code.
-
-File: {file_name}
+File: %s
 
 Code:
-```{language}
-{code}
+```%s
+%s
 ```
 
 Analyze for:
@@ -214,18 +173,18 @@ For each finding, provide:
 - Confidence: Your confidence level (0.0 to 1.0)
 
 Format your response as JSON with this structure:
-{{
+{
   "findings": [
-    {{
+    {
       "type": "SECURITY",
       "severity": "critical",
       "line": 42,
       "message": "SQL injection vulnerability",
       "remediation": "Use parameterized queries",
       "confidence": 0.95,
-      "code_snippet": "query = f'SELECT * FROM users WHERE id = {{user_input}}'"  # Example: SQL injection pattern (for demonstration)
-    }},
-    {{
+      "code_snippet": "query = f'SELECT * FROM users WHERE id = {user_input}'"  # Example: SQL injection pattern (for demonstration)
+    },
+    {
       "type": "BUG",
       "severity": "high",
       "line": 15,
@@ -233,14 +192,98 @@ Format your response as JSON with this structure:
       "remediation": "Add null check",
       "confidence": 0.85,
       "code_snippet": "name = user.name"
-    }}
+    }
   ]
-}}
+}
 
-If no findings are found, return: {{"findings": []}}
+If no findings are found, return: {"findings": []}
 """
 
 
+_BATCH_INSTRUCTIONS = """
+The code above contains several files. Each one starts with a line of the form
+"=== FILE: <path> ===". Add a "file_name" field with that exact path to every
+finding, and give line numbers relative to the first line after the header.
+"""
+
+# Fingerprint of the prompt wording. Analysis caches include it in their keys,
+# so editing a template invalidates results produced by the old text.
+PROMPT_VERSION = hashlib.blake2b(
+    "\0".join((
+        _SECURITY_TEMPLATE,
+        _BUG_DETECTION_TEMPLATE,
+        _QUALITY_TEMPLATE,
+        _COMPREHENSIVE_TEMPLATE,
+        _BATCH_INSTRUCTIONS,
+    )).encode(),
+    digest_size=8,
+).hexdigest()
+
+
+def get_security_prompt(file_name: str, code: str, language: str) -> str:
+    """Get security vulnerability analysis prompt.
+
+    Args:
+        file_name: Name of the file being analyzed
+        code: Source code content
+        language: Programming language
+
+    Returns:
+        Formatted prompt string
+    """
+    return _SECURITY_TEMPLATE % (language, file_name, language, code)
+
+
+def get_bug_detection_prompt(file_name: str, code: str, language: str) -> str:
+    """Get bug detection prompt.
+
+    Args:
+        file_name: Name of the file being analyzed
+        code: Source code content
+        language: Programming language
+
+    Returns:
+        Formatted prompt string
+    """
+    return _BUG_DETECTION_TEMPLATE % (language, file_name, language, code)
+
+
+def get_quality_prompt(file_name: str, code: str, language: str) -> str:
+    """Get code quality analysis prompt.
+
+    Args:
+        file_name: Name of the file being analyzed
+        code: Source code content
+        language: Programming language
+
+    Returns:
+        Formatted prompt string
+    """
+    return _QUALITY_TEMPLATE % (language, file_name, language, code)
+
+
+def get_comprehensive_prompt(file_name: str, code: str, language: str) -> str:
+    """Get comprehensive analysis prompt (security + bugs + quality).
+
+    Args:
+        file_name: Name of the file being analyzed
+        code: Source code content
+        language: Programming language
+
+    Returns:
+        Formatted prompt string
+    """
+    return _COMPREHENSIVE_TEMPLATE % (language, file_name, language, code)
+
+
+_PROMPTS = {
+    "security": get_security_prompt,
+    "bugs": get_bug_detection_prompt,
+    "quality": get_quality_prompt,
+    "comprehensive": get_comprehensive_prompt,
+}
+
+
 def get_prompt(analysis_type: str, file_name: str, code: str, language: str) -> str:
     """Get analysis prompt by type.
 
@@ -253,13 +296,26 @@ def get_prompt(analysis_type: str, file_name: str, code: str, language: str) ->
     Returns:
         Formatted prompt string
     """
-    prompts = {
-        "security": get_security_prompt,
-        "bugs": get_bug_detection_prompt,
-        "quality": get_quality_prompt,
-        "comprehensive": get_comprehensive_prompt,
-    }
-
-    prompt_func = prompts.get(analysis_type.lower(), get_comprehensive_prompt)
+    prompt_func = _PROMPTS.get(analysis_type.lower(), get_comprehensive_prompt)
     return prompt_func(file_name, code, language)
 
+
+def get_batch_prompt(analysis_type: str, files: List[Dict[str, Any]]) -> str:
+    """Get analysis prompt covering several files in one request.
+
+    The files are concatenated, each introduced by a "=== FILE: <path> ==="
+    line, and the model is asked to name the file of every finding.
+
+    Args:
+        analysis_type: Type of analysis (security, bugs, quality, comprehensive)
+        files: File data dicts with "path", "content" and "language" keys
+
+    Returns:
+        Formatted prompt string
+    """
+    languages = {f["language"] for f in files}
+    language = languages.pop() if len(languages) == 1 else "mixed"
+    code = "\n".join(f"=== FILE: {f['path']} ===\n{f['content']}" for f in files)
+
+    prompt = get_prompt(analysis_type, f"{len(files)} files", code, language)
+    return prompt + _BATCH_INSTRUCTIONS
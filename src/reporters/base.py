@@ -23,26 +23,16 @@ class BaseReporter(ABC):
             result: Analysis result
 
         Returns:
-            Filtered analysis result
+            Filtered analysis result (result itself if nothing is removed)
         """
         if self.min_severity is None:
             return result
 
-        # Severity order for comparison
-        severity_order = {
-            Severity.CRITICAL: 0,
-            Severity.HIGH: 1,
-            Severity.MEDIUM: 2,
-            Severity.LOW: 3,
-            Severity.INFO: 4,
-        }
-
-        min_level = severity_order.get(self.min_severity, 4)
-        filtered = [
-            f
-            for f in result.findings
-            if severity_order.get(f.severity, 4) <= min_level
-        ]
+        min_level = self.min_severity.order
+        filtered = [f for f in result.findings if f.severity.order <= min_level]
+        if len(filtered) == len(result.findings):
+            # Nothing was dropped; share the original result
+            return result
 
         return AnalysisResult(
             findings=filtered,
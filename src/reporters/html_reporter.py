@@ -1,7 +1,8 @@
 """HTML reporter for visual dashboard."""
 
-from typing import Optional
-from jinja2 import Template
+from collections import Counter
+from typing import Any, Dict, Optional
+from jinja2 import Environment
 from ..core.findings import AnalysisResult, Severity
 from .base import BaseReporter
 
@@ -148,15 +149,17 @@ HTML_TEMPLATE = """
             <h2>Findings</h2>
             {% if findings %}
                 {% for finding in findings %}
-                <div class="finding {{ finding.severity }}">
+                {% set severity = finding.severity.value %}
+                {% set location = finding.location %}
+                <div class="finding {{ severity }}">
                     <div class="finding-header">
-                        <div class="finding-title">{{ finding.type }}: {{ finding.message }}</div>
-                        <span class="finding-severity {{ finding.severity }}">{{ finding.severity }}</span>
+                        <div class="finding-title">{{ finding.type.value }}: {{ finding.message }}</div>
+                        <span class="finding-severity {{ severity }}">{{ severity }}</span>
                     </div>
                     <div class="finding-location">
-                        📁 {{ finding.location.file_path }}
-                        {% if finding.location.line %}
-                            (Line {{ finding.location.line }})
+                        📁 {{ location.file_path }}
+                        {% if location.line %}
+                            (Line {{ location.line }})
                         {% endif %}
                     </div>
                     {% if finding.code_snippet %}
@@ -180,10 +183,50 @@ HTML_TEMPLATE = """
 </html>
 """
 
+# Finding text comes from analyzed code and model output, so everything
+# interpolated into the report is HTML-escaped
+_ENV = Environment(autoescape=True, trim_blocks=True, lstrip_blocks=True)
+
+# The template minus indentation and blank lines: a smaller report and fewer
+# literal chunks to emit. Nothing in it is whitespace-sensitive (no <pre>).
+_HTML_TEMPLATE_MIN = "\n".join(
+    line.strip() for line in HTML_TEMPLATE.splitlines() if line.strip()
+)
+
+# Compiled once at import; rendering does not modify the template
+_COMPILED_TEMPLATE = _ENV.from_string(_HTML_TEMPLATE_MIN)
+
 
 class HTMLReporter(BaseReporter):
     """Reporter that outputs HTML format."""
 
+    def _context(self, result: AnalysisResult) -> Dict[str, Any]:
+        """Build the template variables for a report.
+
+        Args:
+            result: Analysis result
+
+        Returns:
+            Keyword arguments for the HTML template
+        """
+        filtered_result = self.filter_findings(result)
+        findings = filtered_result.findings
+        # Only severity counts are shown, so skip get_summary()'s type pass
+        severity_counts = Counter(f.severity for f in findings)
+
+        return {
+            "timestamp": filtered_result.timestamp.strftime("%Y-%m-%d %H:%M:%S UTC"),
+            "total_findings": len(findings),
+            "critical_count": severity_counts[Severity.CRITICAL],
+            "high_count": severity_counts[Severity.HIGH],
+            "medium_count": severity_counts[Severity.MEDIUM],
+            "low_count": severity_counts[Severity.LOW],
+            "info_count": severity_counts[Severity.INFO],
+            "files_analyzed": filtered_result.files_analyzed,
+            "total_lines": filtered_result.total_lines,
+            "findings": findings,
+        }
+
     def generate(self, result: AnalysisResult) -> str:
         """Generate HTML report.
 
@@ -193,41 +236,21 @@ class HTMLReporter(BaseReporter):
         Returns:
             HTML string
         """
-        filtered_result = self.filter_findings(result)
-        summary = filtered_result.get_summary()
-
-        template = Template(HTML_TEMPLATE)
-        return template.render(
-            timestamp=filtered_result.timestamp.strftime("%Y-%m-%d %H:%M:%S UTC"),
-            total_findings=summary["total_findings"],
-            critical_count=summary["findings_by_severity"]["critical"],
-            high_count=summary["findings_by_severity"]["high"],
-            medium_count=summary["findings_by_severity"]["medium"],
-            low_count=summary["findings_by_severity"]["low"],
-            info_count=summary["findings_by_severity"]["info"],
-            files_analyzed=summary["files_analyzed"],
-            total_lines=summary["total_lines"],
-            findings=[
-                {
-                    "type": f.type.value,
-                    "severity": f.severity.value,
-                    "message": f.message,
-                    "location": f.location,
-                    "code_snippet": f.code_snippet,
-                    "remediation": f.remediation,
-                }
-                for f in filtered_result.findings
-            ],
-        )
+        return _COMPILED_TEMPLATE.render(**self._context(result))
 
     def save(self, result: AnalysisResult, output_path: str) -> None:
         """Save HTML report to file.
 
+        The report is streamed to the file as it renders rather than built
+        as one string first.
+
         Args:
             result: Analysis result
             output_path: Path to save report
         """
-        html_str = self.generate(result)
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(html_str)
-
+        stream = _COMPILED_TEMPLATE.stream(**self._context(result))
+        # Join rendered pieces into larger chunks and encode them ourselves
+        # rather than making many small writes through a text-mode wrapper
+        stream.enable_buffering(100)
+        with open(output_path, "wb") as f:
+            stream.dump(f, encoding="utf-8")
@@ -1,6 +1,7 @@
 """JSON reporter for structured output."""
 
 import json
+from pathlib import Path
 from typing import Optional
 from ..core.findings import AnalysisResult, Severity
 from .base import BaseReporter
@@ -28,7 +29,8 @@ class JSONReporter(BaseReporter):
             result: Analysis result
             output_path: Path to save report
         """
-        json_str = self.generate(result)
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(json_str)
+        # Written as the encoder's bytes, skipping a decode to str and
+        # re-encode through a text-mode file
+        filtered_result = self.filter_findings(result)
+        Path(output_path).write_bytes(filtered_result.to_json_bytes())
 
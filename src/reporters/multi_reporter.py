@@ -0,0 +1,47 @@
+"""Writing one result in several report formats."""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+from ..core.findings import AnalysisResult, Severity
+from .html_reporter import HTMLReporter
+from .json_reporter import JSONReporter
+from .sarif_reporter import SARIFReporter
+
+# Output format name -> reporter class
+REPORTERS = {
+    "json": JSONReporter,
+    "html": HTMLReporter,
+    "sarif": SARIFReporter,
+}
+
+
+def save_all(
+    result: AnalysisResult,
+    paths: Dict[str, str],
+    min_severity: Optional[Severity] = None,
+) -> None:
+    """Save one result in several formats concurrently.
+
+    The findings are filtered once and each report is rendered and written
+    on its own thread.
+
+    Args:
+        result: Analysis result
+        paths: Output path by format name (json, html, sarif)
+        min_severity: Minimum severity to include (None = all)
+    """
+    unknown = set(paths) - set(REPORTERS)
+    if unknown:
+        raise ValueError(f"Unknown report format(s): {', '.join(sorted(unknown))}")
+
+    filtered_result = JSONReporter(min_severity=min_severity).filter_findings(result)
+
+    with ThreadPoolExecutor(max_workers=len(paths) or 1) as executor:
+        futures = [
+            executor.submit(REPORTERS[fmt]().save, filtered_result, path)
+            for fmt, path in paths.items()
+        ]
+        # Surface the first failure, if any
+        for future in futures:
+            future.result()
@@ -2,51 +2,51 @@
 
 import json
 from datetime import datetime
-from typing import Optional
+from pathlib import Path
+from typing import Any, Dict, Optional
 from ..core.findings import AnalysisResult, Severity, FindingType
 from .base import BaseReporter
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
 
-class SARIFReporter(BaseReporter):
-    """Reporter that outputs SARIF format for GitHub."""
+# Finding severity -> SARIF result level
+_SEV_TO_SARIF = {
+    Severity.CRITICAL: "error",
+    Severity.HIGH: "error",
+    Severity.MEDIUM: "warning",
+    Severity.LOW: "note",
+    Severity.INFO: "note",
+}
 
-    def _severity_to_sarif(self, severity: Severity) -> str:
-        """Convert severity to SARIF level.
+# Finding type -> SARIF rule ID and display name
+_RULE_IDS = {t: t.value.upper() for t in FindingType}
+_TYPE_NAMES = {t: t.value.title() for t in FindingType}
 
-        Args:
-            severity: Finding severity
 
-        Returns:
-            SARIF level string
-        """
-        mapping = {
-            Severity.CRITICAL: "error",
-            Severity.HIGH: "error",
-            Severity.MEDIUM: "warning",
-            Severity.LOW: "note",
-            Severity.INFO: "note",
-        }
-        return mapping.get(severity, "warning")
+class SARIFReporter(BaseReporter):
+    """Reporter that outputs SARIF format for GitHub."""
 
-    def _type_to_rule_id(self, finding_type: FindingType) -> str:
-        """Convert finding type to rule ID.
+    def __init__(self, min_severity: Optional[Severity] = None, pretty: bool = False):
+        """Initialize reporter.
 
         Args:
-            finding_type: Finding type
-
-        Returns:
-            Rule ID string
+            min_severity: Minimum severity to include (None = all)
+            pretty: Indent the JSON output instead of writing it compactly
         """
-        return finding_type.value.upper()
+        super().__init__(min_severity)
+        self.pretty = pretty
 
-    def generate(self, result: AnalysisResult) -> str:
-        """Generate SARIF report.
+    def _build_sarif(self, result: AnalysisResult) -> Dict[str, Any]:
+        """Build the SARIF document for a result.
 
         Args:
             result: Analysis result
 
         Returns:
-            SARIF JSON string
+            SARIF log as a dict
         """
         filtered_result = self.filter_findings(result)
 
@@ -69,66 +69,102 @@ class SARIFReporter(BaseReporter):
             ],
         }
 
-        # Add rules
-        rule_ids = set()
+        # Rules and results in one pass; rules are listed in first-seen order
+        # and results point at theirs by index as well as by ID
+        rules = []
+        rule_indexes = {}
+        results = []
+        # Normalized URIs by raw path; findings usually share a few files
+        uris = {}
         for finding in filtered_result.findings:
-            rule_id = self._type_to_rule_id(finding.type)
-            if rule_id not in rule_ids:
-                sarif["runs"][0]["tool"]["driver"]["rules"].append(
+            rule_id = _RULE_IDS[finding.type]
+            rule_index = rule_indexes.get(rule_id)
+            if rule_index is None:
+                rule_index = rule_indexes[rule_id] = len(rules)
+                type_name = _TYPE_NAMES[finding.type]
+                rules.append(
                     {
                         "id": rule_id,
-                        "name": finding.type.value.title(),
-                        "shortDescription": {"text": finding.type.value.title()},
+                        "name": type_name,
+                        "shortDescription": {"text": type_name},
                     }
                 )
-                rule_ids.add(rule_id)
 
-        # Add results
-        for finding in filtered_result.findings:
-            result_item = {
-                "ruleId": self._type_to_rule_id(finding.type),
-                "level": self._severity_to_sarif(finding.severity),
-                "message": {"text": finding.message},
-                "locations": [
-                    {
-                        "physicalLocation": {
-                            "artifactLocation": {
-                                "uri": finding.location.file_path.replace("\\", "/")
-                            },
-                            "region": {},
-                        }
-                    }
-                ],
-            }
-
-            # Add line information
-            if finding.location.line:
-                result_item["locations"][0]["physicalLocation"]["region"][
-                    "startLine"
-                ] = finding.location.line
-                if finding.location.end_line:
-                    result_item["locations"][0]["physicalLocation"]["region"][
-                        "endLine"
-                    ] = finding.location.end_line
-
-            # Add code snippet
+            location = finding.location
+            file_path = location.file_path
+            uri = uris.get(file_path)
+            if uri is None:
+                uri = uris[file_path] = file_path.replace("\\", "/")
+
+            # Region first, so the result is built as a single literal
+            region = {}
+            if location.line:
+                region["startLine"] = location.line
+                if location.end_line:
+                    region["endLine"] = location.end_line
             if finding.code_snippet:
-                result_item["locations"][0]["physicalLocation"]["region"][
-                    "snippet"
-                ] = {"text": finding.code_snippet}
+                region["snippet"] = {"text": finding.code_snippet}
 
-            sarif["runs"][0]["results"].append(result_item)
+            results.append(
+                {
+                    "ruleId": rule_id,
+                    "ruleIndex": rule_index,
+                    "level": _SEV_TO_SARIF.get(finding.severity, "warning"),
+                    "message": {"text": finding.message},
+                    "locations": [
+                        {
+                            "physicalLocation": {
+                                "artifactLocation": {"uri": uri},
+                                "region": region,
+                            }
+                        }
+                    ],
+                }
+            )
+
+        run = sarif["runs"][0]
+        run["tool"]["driver"]["rules"] = rules
+        run["results"] = results
+        return sarif
+
+    def _encode(self, sarif: Dict[str, Any]) -> bytes:
+        """Encode a SARIF document as UTF-8 JSON.
+
+        Args:
+            sarif: SARIF log
+
+        Returns:
+            SARIF JSON bytes
+        """
+        if orjson is not None:
+            return orjson.dumps(sarif, option=orjson.OPT_INDENT_2 if self.pretty else 0)
+        if self.pretty:
+            text = json.dumps(sarif, indent=2, ensure_ascii=False)
+        else:
+            text = json.dumps(sarif, separators=(",", ":"), ensure_ascii=False)
+        return text.encode("utf-8")
+
+    def generate(self, result: AnalysisResult) -> str:
+        """Generate SARIF report.
 
-        return json.dumps(sarif, indent=2)
+        Args:
+            result: Analysis result
+
+        Returns:
+            SARIF JSON string
+        """
+        return self._encode(self._build_sarif(result)).decode()
 
     def save(self, result: AnalysisResult, output_path: str) -> None:
         """Save SARIF report to file.
 
+        The document is encoded in one call and the bytes written as-is:
+        json.dump would stream it, but only through the pure-Python
+        encoder, which is several times slower.
+
         Args:
             result: Analysis result
             output_path: Path to save report
         """
-        sarif_str = self.generate(result)
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(sarif_str)
+        Path(output_path).write_bytes(self._encode(self._build_sarif(result)))
 
@@ -6,17 +6,25 @@ from src.core.analyzer import CodeAnalyzer
 from src.core.findings import FindingType, Severity
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_api_key():
     """Mock API key for testing."""
     return "sk-test-key"
 
 
-@pytest.fixture
-def analyzer(mock_api_key):
-    """Create analyzer instance for testing."""
+@pytest.fixture(scope="session")
+def shared_analyzer(mock_api_key):
+    """Create one analyzer instance for the whole test session."""
     with patch.dict("os.environ", {"ANTHROPIC_API_KEY": mock_api_key}):
-        return CodeAnalyzer(api_key=mock_api_key)
+        return CodeAnalyzer(api_key=mock_api_key, use_cache=False)
+
+
+@pytest.fixture
+def analyzer(shared_analyzer):
+    """Provide the shared analyzer, restoring any clients a test replaces."""
+    client, async_client = shared_analyzer.client, shared_analyzer.async_client
+    yield shared_analyzer
+    shared_analyzer.client, shared_analyzer.async_client = client, async_client
 
 
 def test_analyzer_initialization(analyzer):
@@ -35,16 +43,15 @@ def test_analyzer_missing_api_key():
 @patch("src.core.analyzer.Anthropic")
 def test_analyze_code_success(mock_anthropic, analyzer):
     """Test successful code analysis."""
-    # Mock API response
-    mock_response = MagicMock()
-    mock_response.content = [
-        MagicMock(
-            text='{"findings": [{"type": "SECURITY", "severity": "critical", "line": 10, "message": "SQL injection", "remediation": "Use parameterized queries", "confidence": 0.95}]}'
-        )
+    # Mock streamed API response
+    mock_stream = MagicMock()
+    mock_stream.text_stream = [
+        '{"findings": [{"type": "SECURITY", "severity": "critical", "line": 10, ',
+        '"message": "SQL injection", "remediation": "Use parameterized queries", "confidence": 0.95}]}',
     ]
 
     mock_client = MagicMock()
-    mock_client.messages.create.return_value = mock_response
+    mock_client.messages.stream.return_value.__enter__.return_value = mock_stream
     mock_anthropic.return_value = mock_client
     analyzer.client = mock_client
 
@@ -96,3 +103,244 @@ def test_parse_api_response(analyzer):
     assert findings[0].type == FindingType.BUG
     assert findings[0].severity == Severity.HIGH
 
+
+
+def test_analyze_directory(analyzer, tmp_path):
+    """Test small files in a directory are analyzed in one batched request."""
+    (tmp_path / "a.py").write_text("x = 1\n")
+    (tmp_path / "b.py").write_text("y = 2\nz = 3\n")
+
+    mock_stream = MagicMock()
+    mock_stream.text_stream.__aiter__.return_value = [
+        '{"findings": ['
+        '{"type": "BUG", "severity": "low", "line": 1, "message": "Issue", "file_name": "a.py"}, '
+        '{"type": "BUG", "severity": "low", "line": 2, "message": "Issue", "file_name": "%s"}'
+        "]}" % (tmp_path / "b.py")
+    ]
+    mock_client = MagicMock()
+    mock_client.__aenter__.return_value = mock_client
+    mock_client.messages.stream.return_value.__aenter__.return_value = mock_stream
+
+    with patch("src.core.analyzer.AsyncAnthropic", return_value=mock_client):
+        result = analyzer.analyze_directory(str(tmp_path))
+
+    assert result.files_analyzed == 2
+    assert result.total_lines == 3
+    assert [f.location.file_path for f in result.findings] == [
+        str(tmp_path / "a.py"),
+        str(tmp_path / "b.py"),
+    ]
+    assert mock_client.messages.stream.call_count == 1
+
+
+def test_analyze_directory_opens_client_per_run(analyzer, tmp_path):
+    """Test each sync run uses and closes its own async client."""
+    (tmp_path / "a.py").write_text("x = 1\n")
+    clients = []
+
+    def make_client(**kwargs):
+        mock_stream = MagicMock()
+        mock_stream.text_stream.__aiter__.return_value = ['{"findings": []}']
+        client = MagicMock()
+        client.__aenter__.return_value = client
+        client.messages.stream.return_value.__aenter__.return_value = mock_stream
+        clients.append(client)
+        return client
+
+    with patch("src.core.analyzer.AsyncAnthropic", side_effect=make_client) as factory:
+        analyzer.analyze_directory(str(tmp_path))
+        analyzer.analyze_directory(str(tmp_path))
+
+    assert factory.call_count == 2
+    for client in clients:
+        assert client.messages.stream.call_count == 1
+        client.__aexit__.assert_awaited_once()
+
+
+def test_parse_api_response_fenced(analyzer):
+    """Test JSON is extracted from a fenced block with surrounding prose."""
+    response = (
+        "Here is the analysis {summary below}:\n"
+        "```json\n"
+        '{"findings": [{"type": "BUG", "severity": "low", "line": 1, "message": "Unbalanced \\"}\\" in string"}]}\n'
+        "```\n"
+        "Let me know if you need more {details}."
+    )
+    findings = analyzer._parse_api_response(response, "test.py")
+
+    assert len(findings) == 1
+    assert findings[0].message == 'Unbalanced "}" in string'
+
+
+def test_parse_api_response_trailing_fence(analyzer):
+    """Test fenced code after the JSON object does not hide the object."""
+    response = (
+        '{"findings": [{"type": "BUG", "severity": "low", "line": 1, "message": "Issue"}]}\n'
+        "For example:\n"
+        "```python\n"
+        "print({1: 2})\n"
+        "```"
+    )
+    findings = analyzer._parse_api_response(response, "test.py")
+
+    assert len(findings) == 1
+    assert findings[0].message == "Issue"
+
+
+def test_json_stream_scanner():
+    """Test streamed JSON is detected as complete only when unambiguous."""
+    from src.core.analyzer import _JsonStreamScanner
+
+    scanner = _JsonStreamScanner()
+    chunks = ["```js", 'on\n{"findings": [{"message": "a }', ' b"}]}', "\n```\nTrailing notes"]
+    completed = [scanner.feed(chunk) for chunk in chunks[:3]]
+    assert completed == [False, False, True]
+
+    # Prose before the object: a later fence could still change the answer
+    scanner = _JsonStreamScanner()
+    assert scanner.feed("Summary {see below}") is False
+    assert scanner.feed('\n```json\n{"findings": []}\n```') is False
+
+
+def test_analyze_code_cache(mock_api_key, tmp_path):
+    """Test repeated analysis of the same code is served from the cache."""
+    analyzer = CodeAnalyzer(api_key=mock_api_key, cache_dir=str(tmp_path))
+    mock_stream = MagicMock()
+    mock_stream.text_stream = ['{"findings": [{"type": "BUG", "severity": "low", "line": 1, "message": "Issue"}]}']
+    mock_client = MagicMock()
+    mock_client.messages.stream.return_value.__enter__.return_value = mock_stream
+    analyzer.client = mock_client
+
+    first = analyzer.analyze_code(code="x = 1", language="python", file_name="a.py")
+    second = analyzer.analyze_code(code="x = 1", language="python", file_name="a.py")
+    assert first == second
+    assert mock_client.messages.stream.call_count == 1
+
+    # A fresh analyzer picks the result up from disk
+    fresh = CodeAnalyzer(api_key=mock_api_key, cache_dir=str(tmp_path))
+    fresh.client = MagicMock()
+    assert fresh.analyze_code(code="x = 1", language="python", file_name="a.py") == first
+    fresh.client.messages.stream.assert_not_called()
+
+
+def test_analyze_code_does_not_cache_unparseable_response(mock_api_key, tmp_path):
+    """Test a response without usable JSON is not cached."""
+    analyzer = CodeAnalyzer(api_key=mock_api_key, cache_dir=str(tmp_path))
+    mock_stream = MagicMock()
+    mock_stream.text_stream = ["Sorry, I could not analyze this file."]
+    mock_client = MagicMock()
+    mock_client.messages.stream.return_value.__enter__.return_value = mock_stream
+    analyzer.client = mock_client
+
+    assert analyzer.analyze_code(code="x = 1", language="python", file_name="a.py") == []
+
+    mock_stream.text_stream = ['{"findings": [{"type": "BUG", "severity": "low", "line": 1, "message": "Issue"}]}']
+    findings = analyzer.analyze_code(code="x = 1", language="python", file_name="a.py")
+    assert len(findings) == 1
+    assert mock_client.messages.stream.call_count == 2
+
+
+def _mock_async_client(responses):
+    """Build an async client mock whose streams return responses in turn."""
+    def make_stream(**kwargs):
+        mock_stream = MagicMock()
+        mock_stream.text_stream.__aiter__.return_value = [responses.pop(0)]
+        context = MagicMock()
+        context.__aenter__.return_value = mock_stream
+        return context
+
+    client = MagicMock()
+    client.__aenter__.return_value = client
+    client.messages.stream.side_effect = make_stream
+    return client
+
+
+def test_analyze_batch_falls_back_on_truncated_response(analyzer):
+    """Test a cut-off batch response is retried one file at a time."""
+    files = [
+        {"path": "a.py", "content": "x = 1", "language": "python"},
+        {"path": "b.py", "content": "y = 2", "language": "python"},
+    ]
+    client = _mock_async_client([
+        '{"findings": [{"type": "BUG", "severity": "low", "line": 1, "message": "Iss',
+        '{"findings": [{"type": "BUG", "severity": "low", "line": 1, "message": "A"}]}',
+        '{"findings": []}',
+    ])
+
+    with patch("src.core.analyzer.AsyncAnthropic", return_value=client):
+        results = analyzer.analyze_batch(files)
+
+    assert [f.message for f in results["a.py"]] == ["A"]
+    assert results["b.py"] == []
+    assert client.messages.stream.call_count == 3
+
+
+def test_route_findings_requires_unique_basename(analyzer):
+    """Test basename matching is only used when the basename is unique."""
+    from src.core.findings import Finding, Location
+
+    def finding(file_path):
+        return Finding(
+            type=FindingType.BUG,
+            severity=Severity.LOW,
+            message="Issue",
+            location=Location(file_path=file_path, line=1),
+        )
+
+    paths = ["pkg/a/__init__.py", "pkg/b/__init__.py", "pkg/util.py"]
+    routed = analyzer._route_findings([finding("util.py"), finding("pkg/a/__init__.py")], paths)
+    assert [f.location.file_path for f in routed["pkg/util.py"]] == ["pkg/util.py"]
+    assert len(routed["pkg/a/__init__.py"]) == 1
+
+    assert analyzer._route_findings([finding("__init__.py")], paths) is None
+    assert analyzer._route_findings([finding("")], paths) is None
+
+
+def test_parse_api_response_ignores_file_name_for_single_file(analyzer):
+    """Test a model-supplied file_name does not relocate single-file findings."""
+    response = '{"findings": [{"type": "BUG", "line": 1, "message": "Issue", "file_name": "other.py"}]}'
+    findings = analyzer._parse_api_response(response, "test.py")
+
+    assert findings[0].location.file_path == "test.py"
+
+
+def test_build_request_scales_max_tokens(analyzer):
+    """Test batch requests get a per-file output budget up to the model limit."""
+    limit = analyzer._output_token_limit()
+    assert analyzer._build_request("prompt")["max_tokens"] == min(analyzer.MAX_TOKENS, limit)
+    assert analyzer._build_request("prompt", files=10)["max_tokens"] == limit
+
+
+def test_analyze_code_cache_in_memory_by_default(mock_api_key):
+    """Test the cache stays in memory unless a cache_dir is given."""
+    analyzer = CodeAnalyzer(api_key=mock_api_key)
+    mock_stream = MagicMock()
+    mock_stream.text_stream = ['{"findings": []}']
+    analyzer.client = MagicMock()
+    analyzer.client.messages.stream.return_value.__enter__.return_value = mock_stream
+
+    with patch("src.core.analyzer.shelve.open") as shelve_open:
+        analyzer.analyze_code(code="x = 1", language="python", file_name="a.py")
+        analyzer.analyze_code(code="x = 1", language="python", file_name="a.py")
+
+    shelve_open.assert_not_called()
+    assert analyzer.client.messages.stream.call_count == 1
+
+
+def test_analyze_files_data(analyzer):
+    """Test file data read by the caller is analyzed without touching disk."""
+    files_data = [
+        {"path": "a.py", "content": "x = 1\n", "language": "python", "size_bytes": 6, "line_count": 1},
+        {"path": "b.py", "content": "y = 2\n", "language": "python", "size_bytes": 6, "line_count": 1},
+    ]
+    client = _mock_async_client([
+        '{"findings": [{"type": "BUG", "severity": "low", "line": 1, "message": "Issue", "file_name": "b.py"}]}'
+    ])
+
+    with patch("src.core.analyzer.AsyncAnthropic", return_value=client):
+        result = analyzer.analyze_files_data(files_data, directory="src")
+
+    assert result.files_analyzed == 2
+    assert result.total_lines == 2
+    assert [f.location.file_path for f in result.findings] == ["b.py"]
+    assert result.metadata["directory"] == "src"
@@ -9,6 +9,7 @@ from src.core.findings import Finding, FindingType, Severity, Location
 client = TestClient(app)
 
 
+@patch("src.api.routes._analyzer", None)
 @patch("src.api.routes.CodeAnalyzer")
 def test_analyze_endpoint(mock_analyzer_class):
     """Test /api/analyze endpoint."""
@@ -41,6 +42,26 @@ def test_analyze_endpoint(mock_analyzer_class):
     assert data["success"] is True
     assert len(data["findings"]) == 1
     assert data["findings"][0]["severity"] == "critical"
+    assert data["total_lines"] == 1
+    assert data["findings_by_severity"]["critical"] == 1
+
+
+@pytest.mark.parametrize("file_name", [None, ""])
+@patch("src.api.routes._analyzer", None)
+@patch("src.api.routes.CodeAnalyzer")
+def test_analyze_endpoint_missing_file_name(mock_analyzer_class, file_name):
+    """Test a null or empty file_name is accepted and analyzed as "unknown"."""
+    mock_analyzer = MagicMock()
+    mock_analyzer.analyze_code.return_value = []
+    mock_analyzer_class.return_value = mock_analyzer
+
+    response = client.post(
+        "/api/analyze",
+        json={"code": "x = 1", "language": "python", "file_name": file_name},
+    )
+
+    assert response.status_code == 200
+    assert mock_analyzer.analyze_code.call_args.kwargs["file_name"] == "unknown"
 
 
 def test_health_endpoint():
@@ -79,3 +100,61 @@ def test_analyze_endpoint_invalid_request():
     )
     assert response.status_code == 422  # Validation error
 
+
+
+def test_rate_limit_middleware():
+    """Test requests over the per-minute limit are rejected."""
+    from fastapi import FastAPI
+    from src.api.middleware import CombinedMiddleware
+
+    limited_app = FastAPI()
+    limited_app.add_middleware(CombinedMiddleware, requests_per_minute=2)
+
+    @limited_app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    limited_client = TestClient(limited_app)
+    assert limited_client.get("/ping").status_code == 200
+    assert limited_client.get("/ping").status_code == 200
+
+    response = limited_client.get("/ping")
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "60"
+
+
+def test_security_headers():
+    """Test security headers are added to responses."""
+    response = client.get("/")
+
+    assert response.headers["X-Content-Type-Options"] == "nosniff"
+    assert response.headers["X-Frame-Options"] == "DENY"
+    assert response.headers["Content-Security-Policy"] == "default-src 'self'"
+
+
+def test_unhandled_exception_returns_500():
+    """Test unhandled route errors are turned into a JSON 500 response."""
+    from fastapi import FastAPI
+    from src.api.middleware import CombinedMiddleware
+
+    failing_app = FastAPI()
+    failing_app.add_middleware(CombinedMiddleware)
+
+    @failing_app.get("/boom")
+    async def boom():
+        raise RuntimeError("boom")
+
+    response = TestClient(failing_app).get("/boom")
+    assert response.status_code == 500
+    assert response.json()["detail"] == "Internal server error"
+    assert response.headers["X-Frame-Options"] == "DENY"
+
+
+@patch("src.api.routes._analyzer", None)
+@patch("src.api.routes.CodeAnalyzer")
+def test_get_analyzer_reuses_instance(mock_analyzer_class):
+    """Test the API analyzer is created once and reused."""
+    from src.api.routes import get_analyzer
+
+    assert get_analyzer() is get_analyzer()
+    mock_analyzer_class.assert_called_once_with()
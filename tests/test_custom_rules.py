@@ -0,0 +1,83 @@
+"""Tests for the custom pattern rules example."""
+
+from examples.custom_rules import check_custom_patterns
+
+
+def test_check_custom_patterns_reports_overlapping_rules():
+    """Test that rules matching the same span are all reported."""
+    code = (
+        "import os\n"
+        "query = f\"SELECT * FROM users WHERE id = {uid}\"; token = 'abc123'\n"
+    )
+    
+    findings = check_custom_patterns(code, "app.py")
+    
+    rules = sorted(f.rule_id for f in findings)
+    assert rules == ["hardcoded_secrets", "sql_injection_risk"]
+    assert all(f.location.line == 2 for f in findings)
+
+
+def test_check_custom_patterns_skips_files_without_anchors():
+    """Test that no findings are produced when no rule anchor occurs."""
+    assert check_custom_patterns("x = 1\n", "app.py") == []
+
+
+def test_analyze_with_custom_rules_does_not_cache_parse_failures(monkeypatch, tmp_path):
+    """Test an unparseable response is retried on the next call."""
+    from examples import custom_rules
+    
+    responses = [None, []]
+    calls = []
+    
+    def fake_call_claude(code, language, custom_prompt):
+        calls.append(code)
+        return responses[len(calls) - 1]
+    
+    monkeypatch.delenv("PROACTIVE_CACHE", raising=False)
+    monkeypatch.setattr(custom_rules, "RESPONSE_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(custom_rules, "_call_claude", fake_call_claude)
+    custom_rules._cached_analysis.cache_clear()
+    
+    assert custom_rules.analyze_with_custom_rules("x = 1", "python", "rules") == []
+    assert custom_rules.analyze_with_custom_rules("x = 1", "python", "rules") == []
+    assert custom_rules.analyze_with_custom_rules("x = 1", "python", "rules") == []
+    assert len(calls) == 2
+    custom_rules._cached_analysis.cache_clear()
+
+
+def test_analyze_files_async_keeps_results_when_one_request_fails(monkeypatch):
+    """Test one failed request does not discard the other files' findings."""
+    import asyncio
+    from unittest.mock import AsyncMock, MagicMock, patch
+    from examples import custom_rules
+    
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    ok_response = MagicMock()
+    ok_response.content = [MagicMock(
+        text='{"findings": [{"type": "SECURITY", "severity": "high", "line": 1, "message": "Issue"}]}'
+    )]
+    mock_client = MagicMock()
+    mock_client.messages.create = AsyncMock(side_effect=[ok_response, RuntimeError("boom")])
+    files_data = [
+        {"path": "a.py", "content": "x = 1", "language": "python"},
+        {"path": "b.py", "content": "y = 2", "language": "python"},
+    ]
+    
+    with patch("anthropic.AsyncAnthropic", return_value=mock_client):
+        findings = asyncio.run(custom_rules._analyze_files_async(files_data, "rules"))
+    
+    assert [f.location.file_path for f in findings] == ["a.py"]
+
+
+def test_should_scan_skips_oversize_and_binary_files(monkeypatch):
+    """Test the custom passes skip oversize and binary file data."""
+    from examples import custom_rules
+    
+    monkeypatch.setattr(custom_rules, "MAX_SCAN_BYTES", 10)
+    
+    def file_data(content):
+        return {"path": "app.py", "content": content, "size_bytes": len(content)}
+    
+    assert custom_rules._should_scan(file_data("x = 1\n"))
+    assert not custom_rules._should_scan(file_data("x = 1\n" * 5))
+    assert not custom_rules._should_scan(file_data("x\x00y"))
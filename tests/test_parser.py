@@ -0,0 +1,99 @@
+"""Tests for parser module."""
+
+import pytest
+from src.core.parser import CodeParser
+
+
+@pytest.fixture
+def parser():
+    """Create parser instance for testing."""
+    return CodeParser()
+
+
+@pytest.fixture
+def sample_tree(tmp_path):
+    """Create a small source tree with ignored and unsupported files."""
+    (tmp_path / "app.py").write_text("print('hello')\n")
+    (tmp_path / "notes.txt").write_text("not code\n")
+    (tmp_path / "bundle.min.js").write_text("var a=1;\n")
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "util.js").write_text("export const x = 1;\n")
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "node_modules" / "dep.js").write_text("module.exports = {};\n")
+    return tmp_path
+
+
+def test_get_files_to_analyze(parser, sample_tree):
+    """Test directory walk applies ignore and language filters."""
+    files = parser.get_files_to_analyze(str(sample_tree))
+
+    assert sorted(files) == sorted(
+        [str(sample_tree / "app.py"), str(sample_tree / "pkg" / "util.js")]
+    )
+
+
+def test_get_files_to_analyze_single_file(parser, sample_tree):
+    """Test a single file path is returned as-is."""
+    file_path = str(sample_tree / "app.py")
+    assert parser.get_files_to_analyze(file_path) == [file_path]
+
+
+def test_get_files_to_analyze_missing_directory(parser, tmp_path):
+    """Test missing directory yields no files."""
+    assert parser.get_files_to_analyze(str(tmp_path / "missing")) == []
+
+
+def test_should_analyze_file_too_large(sample_tree):
+    """Test files above the size limit are skipped."""
+    parser = CodeParser(max_file_size_kb=1)
+    big_file = sample_tree / "big.py"
+    big_file.write_text("x = 1\n" * 1000)
+
+    assert parser.should_analyze_file(str(big_file)) is False
+    assert parser.should_analyze_file(str(sample_tree / "app.py")) is True
+
+
+def test_analyze_file(parser, sample_tree):
+    """Test file analysis returns content and metadata."""
+    file_data = parser.analyze_file(str(sample_tree / "app.py"))
+
+    assert file_data["language"] == "python"
+    assert file_data["content"] == "print('hello')\n"
+    assert file_data["line_count"] == 1
+    assert file_data["size_bytes"] == 15
+
+
+def test_ignored_root_directory(parser, sample_tree):
+    """Test scanning inside an ignored directory yields no files."""
+    assert parser.get_files_to_analyze(str(sample_tree / "node_modules")) == []
+    assert parser.should_analyze_file(str(sample_tree / "node_modules" / "dep.js")) is False
+
+
+def test_read_file_encodings(parser, tmp_path):
+    """Test UTF-8, BOM, CRLF and non-UTF-8 files are decoded."""
+    utf8 = tmp_path / "utf8.py"
+    utf8.write_bytes("s = 'héllo'\r\n".encode("utf-8"))
+    assert parser.read_file(str(utf8)) == ("s = 'héllo'\n", "utf-8", 14)
+
+    bom = tmp_path / "bom.py"
+    bom.write_bytes(b"\xef\xbb\xbfx = 1\n")
+    assert parser.read_file(str(bom)) == ("x = 1\n", "utf-8-sig", 9)
+
+    latin = tmp_path / "latin.py"
+    latin.write_bytes("# café crème brûlée à la française\n".encode("latin-1") * 5)
+    content, encoding, _ = parser.read_file(str(latin))
+    assert encoding != "utf-8"
+    assert "caf" in content
+
+
+def test_analyze_files(parser, sample_tree):
+    """Test concurrent analysis keeps input order and drops skipped files."""
+    paths = [
+        str(sample_tree / "pkg" / "util.js"),
+        str(sample_tree / "notes.txt"),
+        str(sample_tree / "app.py"),
+    ]
+    results = parser.analyze_files(paths)
+
+    assert [r["language"] for r in results] == ["javascript", "python"]
+    assert parser.analyze_files([]) == []
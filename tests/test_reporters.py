@@ -6,6 +6,7 @@ from src.core.findings import AnalysisResult, Finding, FindingType, Severity, Lo
 from src.reporters.json_reporter import JSONReporter
 from src.reporters.html_reporter import HTMLReporter
 from src.reporters.sarif_reporter import SARIFReporter
+from src.reporters.multi_reporter import save_all
 
 
 @pytest.fixture
@@ -31,52 +32,87 @@ def sample_result():
     )
 
 
-def test_json_reporter(sample_result, tmp_path):
-    """Test JSON reporter."""
-    reporter = JSONReporter()
-    json_str = reporter.generate(sample_result)
+@pytest.mark.parametrize(
+    "reporter_cls, file_name",
+    [
+        (JSONReporter, "report.json"),
+        (HTMLReporter, "report.html"),
+        (SARIFReporter, "report.sarif"),
+    ],
+)
+def test_reporter_save_matches_generate(reporter_cls, file_name, sample_result, tmp_path):
+    """Test each reporter includes the finding and saves what it generates."""
+    reporter = reporter_cls()
+    report = reporter.generate(sample_result)
+    assert "SQL injection" in report
+
+    output_file = tmp_path / file_name
+    reporter.save(sample_result, str(output_file))
+    assert output_file.read_text(encoding="utf-8") == report
 
-    # Verify it's valid JSON
-    data = json.loads(json_str)
+
+def test_json_reporter(sample_result):
+    """Test JSON reporter."""
+    data = json.loads(JSONReporter().generate(sample_result))
     assert "findings" in data
     assert len(data["findings"]) == 1
 
-    # Test saving
-    output_file = tmp_path / "report.json"
-    reporter.save(sample_result, str(output_file))
-    assert output_file.exists()
-
 
-def test_html_reporter(sample_result, tmp_path):
+def test_html_reporter(sample_result):
     """Test HTML reporter."""
-    reporter = HTMLReporter()
-    html_str = reporter.generate(sample_result)
+    assert "<!DOCTYPE html>" in HTMLReporter().generate(sample_result)
 
-    # Verify it's HTML
-    assert "<!DOCTYPE html>" in html_str
-    assert "SQL injection" in html_str
 
-    # Test saving
-    output_file = tmp_path / "report.html"
-    reporter.save(sample_result, str(output_file))
-    assert output_file.exists()
+def test_html_reporter_escapes_findings(sample_result):
+    """Test finding text is HTML-escaped in the report."""
+    sample_result.findings[0].message = "<script>alert(1)</script>"
+    html_str = HTMLReporter().generate(sample_result)
 
+    assert "<script>alert(1)</script>" not in html_str
+    assert "&lt;script&gt;alert(1)&lt;/script&gt;" in html_str
 
-def test_sarif_reporter(sample_result, tmp_path):
-    """Test SARIF reporter."""
-    reporter = SARIFReporter()
-    sarif_str = reporter.generate(sample_result)
 
-    # Verify it's valid SARIF JSON
-    data = json.loads(sarif_str)
+def test_sarif_reporter(sample_result):
+    """Test SARIF reporter."""
+    data = json.loads(SARIFReporter().generate(sample_result))
     assert "version" in data
     assert "runs" in data
     assert len(data["runs"][0]["results"]) == 1
+    sarif_result = data["runs"][0]["results"][0]
+    rules = data["runs"][0]["tool"]["driver"]["rules"]
+    assert rules[sarif_result["ruleIndex"]]["id"] == sarif_result["ruleId"] == "SECURITY"
+
+
+def test_filter_findings_sees_in_place_changes(sample_result):
+    """Test filtering again reflects findings changed since the last filter."""
+    sample_result.findings.append(
+        Finding(
+            type=FindingType.QUALITY,
+            severity=Severity.LOW,
+            message="Code style issue",
+            location=Location(file_path="test.py", line=20),
+        )
+    )
 
-    # Test saving
-    output_file = tmp_path / "report.sarif"
-    reporter.save(sample_result, str(output_file))
-    assert output_file.exists()
+    filtered = JSONReporter(min_severity=Severity.HIGH).filter_findings(sample_result)
+    assert len(filtered.findings) == 1
+
+    sample_result.findings[1].severity = Severity.HIGH
+    refiltered = SARIFReporter(min_severity=Severity.HIGH).filter_findings(sample_result)
+    assert len(refiltered.findings) == 2
+
+
+def test_save_all(sample_result, tmp_path):
+    """Test one result is written in every requested format."""
+    paths = {fmt: str(tmp_path / f"report.{fmt}") for fmt in ("json", "html", "sarif")}
+    save_all(sample_result, paths, min_severity=Severity.HIGH)
+
+    assert len(json.loads((tmp_path / "report.json").read_text())["findings"]) == 1
+    assert "SQL injection" in (tmp_path / "report.html").read_text(encoding="utf-8")
+    assert json.loads((tmp_path / "report.sarif").read_text())["version"] == "2.1.0"
+
+    with pytest.raises(ValueError, match="pdf"):
+        save_all(sample_result, {"pdf": str(tmp_path / "report.pdf")})
 
 
 def test_reporter_severity_filter(sample_result):